@@ -12,21 +12,149 @@ Final Cut Pro Bundle Cleaner - Interactive File Browser
     s        - بدء المسح في المسار الحالي
 """
 
+import os
 import sys
 import curses
+import textwrap
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
-from typing import List, Dict
+from typing import List, Dict, Tuple
 
 # استيراد الوظائف المشتركة
 from fcp_common import (
     TARGET_FOLDERS,
+    TARGET_FOLDERS_SET,
     format_size,
+    get_folder_size,
     find_fcpbundles,
     find_date_folders,
-    get_folder_size,
     delete_folder_safely
 )
 
+# عدد الـ threads لتحليل المشاريع (الشغل I/O فالـ GIL مش مشكلة)
+SCAN_WORKERS = 8
+
+# عدد الـ threads للمسح - rmtree بيسيب الـ GIL أثناء unlink
+DELETE_WORKERS = 8
+
+# Synchronized output (DEC mode 2026): الترمنال بيجمع الفريم ويرسمه مرة واحدة
+# الترمنالات اللي مش بتدعمه بتتجاهل الـ sequence
+_SYNC_BEGIN = "\033[?2026h"
+_SYNC_END = "\033[?2026l"
+
+_colors_inited = False
+
+# مجموعات المفاتيح - فحص واحد بـ in بدل سلسلة مقارنات
+_KEYS_QUIT = frozenset((ord('q'), ord('Q')))
+_KEYS_BACK = frozenset((curses.KEY_BACKSPACE, 127, 8))
+_KEYS_ENTER = frozenset((ord('\n'), curses.KEY_ENTER, 10, 13))
+_KEYS_SCAN = frozenset((ord('s'), ord('S')))
+_KEYS_BROWSER = frozenset((ord('b'), ord('B')))
+_KEYS_TOGGLE = frozenset((ord(' '), ord('\n')))
+_KEYS_YES = frozenset((ord('y'), ord('Y')))
+_KEYS_NO = frozenset((ord('n'), ord('N'), 27))
+
+# attributes جاهزة - بتتملى في _init_colors()
+A_BOLD = curses.A_BOLD
+A_NORMAL = curses.A_NORMAL
+C_DEFAULT = C_CYAN = C_GREEN = C_YELLOW = C_RED = C_INV = 0
+C_CYAN_BOLD = C_GREEN_BOLD = C_YELLOW_BOLD = C_RED_BOLD = C_INV_BOLD = 0
+
+
+# اللوجو - بيتجهز مرة واحدة وقت تحميل الموديول
+_LOGO = """
+     ------------------------------------------------------------
+   ----------------------------------------------------------------
+  ------------------------------------------------------------------
+  ------------------------------------------------------------------
+  --------##############----##############-----#############--------
+  --------##############----##############----##############--------
+  --------##############----##############----##############--------
+  --------##############----##############----##############--------
+  --------##############----##############----##############--------
+  --------##############----##############----##############--------
+  --------##############----##############----##############--------
+  --------##############----##############----##############--------
+  --------##############----##############----##############--------
+  --------##############----##############----##############--------
+  --------##############----##############----##############--------
+  --------##############----##############----##############--------
+  --------##############----##############----##############--------
+  --------##############----##############----##############--------
+  --------##############----##############----##############--------
+  --------##############----##############----##############--------
+  --------##############----##############----##############--------
+  --------##############----##############----##############--------
+  --------##############----##############----##############--------
+  --------##############----##############----##############--------
+  --------##############-----############*----##############--------
+  --------##############----------------------##############--------
+  --------##############----------------------##############--------
+  --------##############----------------------##############--------
+  --------##############----------------------##############--------
+  --------##############----------------------##############--------
+  --------##############----------------------##############--------
+  --------##############-----------------------#############--------
+  ------------------------------------------------------------------
+  ------------------------------------------------------------------
+   ----------------------------------------------------------------
+     ------------------------------------------------------------
+    """
+_LOGO_LINES = tuple(textwrap.dedent(_LOGO).strip('\n').split('\n'))
+_LOGO_MAXLEN = max(len(line) for line in _LOGO_LINES)
+
+
+def _init_colors():
+    """تهيئة ألوان الترمنال وإخفاء المؤشر (مرة واحدة بس)"""
+    global _colors_inited
+    global C_DEFAULT, C_CYAN, C_GREEN, C_YELLOW, C_RED, C_INV
+    global C_CYAN_BOLD, C_GREEN_BOLD, C_YELLOW_BOLD, C_RED_BOLD, C_INV_BOLD
+    if _colors_inited:
+        return
+
+    curses.init_pair(1, curses.COLOR_CYAN, curses.COLOR_BLACK)
+    curses.init_pair(2, curses.COLOR_GREEN, curses.COLOR_BLACK)
+    curses.init_pair(3, curses.COLOR_YELLOW, curses.COLOR_BLACK)
+    curses.init_pair(4, curses.COLOR_RED, curses.COLOR_BLACK)
+    curses.init_pair(5, curses.COLOR_BLACK, curses.COLOR_WHITE)
+
+    # الألوان ثابتة بعد init_pair - نحسبها مرة واحدة بدل كل صف وكل فريم
+    C_DEFAULT = curses.color_pair(0)
+    C_CYAN = curses.color_pair(1)
+    C_GREEN = curses.color_pair(2)
+    C_YELLOW = curses.color_pair(3)
+    C_RED = curses.color_pair(4)
+    C_INV = curses.color_pair(5)
+
+    C_CYAN_BOLD = C_CYAN | A_BOLD
+    C_GREEN_BOLD = C_GREEN | A_BOLD
+    C_YELLOW_BOLD = C_YELLOW | A_BOLD
+    C_RED_BOLD = C_RED | A_BOLD
+    C_INV_BOLD = C_INV | A_BOLD
+
+    curses.curs_set(0)  # إخفاء المؤشر
+    _colors_inited = True
+
+
+def _begin_frame():
+    """بداية فريم - الترمنال يأجل الرسم لحد _end_frame"""
+    sys.stdout.write(_SYNC_BEGIN)
+    sys.stdout.flush()
+
+
+def _end_frame():
+    """نهاية فريم - الترمنال يرسم كل اللي اتجمع مرة واحدة"""
+    sys.stdout.write(_SYNC_END)
+    sys.stdout.flush()
+
+
+def _safe_addstr(win, y: int, x: int, text: str, attr: int = 0):
+    """كتابة نص مقصوص على حدود النافذة - آخر عمود مش بيتلمس فمفيش curses.error"""
+    max_y, max_x = win.getmaxyx()
+    if y >= max_y or x >= max_x - 1:
+        return
+    win.addnstr(y, x, text, max_x - x - 1, attr)
+
 
 def analyze_bundle(bundle_path: Path) -> Dict:
     """تحليل bundle - نسخة مبسطة للمتصفح"""
@@ -39,17 +167,26 @@ def analyze_bundle(bundle_path: Path) -> Dict:
     date_folders = find_date_folders(bundle_path)
 
     for date_folder in date_folders:
+        # قراءة فولدر التاريخ مرة واحدة بدل exists() لكل target
+        try:
+            with os.scandir(date_folder) as it:
+                present = {entry.name: entry.path for entry in it
+                           if entry.name in TARGET_FOLDERS_SET and entry.is_dir(follow_symlinks=False)}
+        except OSError:
+            continue
+
         for target_folder in TARGET_FOLDERS:
-            folder_path = date_folder / target_folder
-            if folder_path.exists():
-                size = get_folder_size(folder_path)
-                if size > 0:
-                    result['folders'].append({
-                        'name': f"{date_folder.name}/{target_folder}",
-                        'path': folder_path,
-                        'size': size,
-                        'deleted': False
-                    })
+            if target_folder not in present:
+                continue
+
+            size = get_folder_size(present[target_folder])
+            if size > 0:
+                result['folders'].append({
+                    'name': f"{date_folder.name}/{target_folder}",
+                    'path': Path(present[target_folder]),
+                    'size': size,
+                    'deleted': False
+                })
 
     return result
 
@@ -59,70 +196,106 @@ class FileBrowser:
 
     def __init__(self, stdscr, start_path: Path):
         self.stdscr = stdscr
-        self.current_path = start_path.resolve()
+        # المسار المطلق (زي Path.home()) مش محتاج resolve واللي فيه من stat
+        self.current_path = start_path if start_path.is_absolute() else start_path.resolve()
+        self._parent = None
         self.current_idx = 0
         self.scroll_offset = 0
         self.selected_path = None
 
-        # الألوان
-        curses.init_pair(1, curses.COLOR_CYAN, curses.COLOR_BLACK)
-        curses.init_pair(2, curses.COLOR_GREEN, curses.COLOR_BLACK)
-        curses.init_pair(3, curses.COLOR_YELLOW, curses.COLOR_BLACK)
-        curses.init_pair(4, curses.COLOR_RED, curses.COLOR_BLACK)
-        curses.init_pair(5, curses.COLOR_BLACK, curses.COLOR_WHITE)
+        # كاش لمحتويات الفولدرات - يتقرا مرة واحدة لكل مسار
+        self._items_cache = {}
+
+        # الخط الفاصل بيتبني بس لما العرض يتغير
+        self._sep_width = 0
+        self._sep = ""
 
-        curses.curs_set(0)
+    def _get_parent(self) -> Path:
+        """الفولدر الأعلى للمسار الحالي - بيتحسب مرة واحدة لكل مسار"""
+        if self._parent is None:
+            self._parent = self.current_path.parent
+        return self._parent
 
     def get_items(self) -> List[Dict]:
-        """الحصول على المجلدات في المسار الحالي"""
+        """الحصول على المجلدات في المسار الحالي (من الكاش لو متاحة)"""
+        cached = self._items_cache.get(self.current_path)
+        if cached is not None:
+            return cached
+
         items = []
 
         try:
             # إضافة .. للرجوع
-            if self.current_path != self.current_path.parent:
+            if self.current_path != self._get_parent():
                 items.append({
                     'name': '..',
-                    'path': self.current_path.parent,
+                    'path': self._get_parent(),
                     'is_parent': True,
                     'is_dir': True
                 })
 
-            # قراءة المجلدات
-            for item in sorted(self.current_path.iterdir()):
-                if item.is_dir() and not item.name.startswith('.'):
-                    items.append({
-                        'name': item.name,
-                        'path': item,
-                        'is_parent': False,
-                        'is_dir': True
-                    })
+            # قراءة المجلدات - scandir بيعرف نوع العنصر من غير stat لكل واحد
+            # (الـ symlinks بس هي اللي بتاخد stat - لازم تظهر زي /tmp و /Volumes/...)
+            entries = []
+            with os.scandir(self.current_path) as it:
+                for e in it:
+                    if e.name.startswith('.'):
+                        continue
+                    try:
+                        if e.is_dir():
+                            entries.append(e)
+                    except OSError:
+                        # symlink بيلف على نفسه (ELOOP) أو مش متاح - نتخطاه
+                        continue
+            entries.sort(key=lambda e: e.name)
+
+            for entry in entries:
+                items.append({
+                    'name': entry.name,
+                    'path': entry.path,  # نص - بيتحول لـ Path عند الدخول فقط
+                    'is_parent': False,
+                    'is_dir': True
+                })
 
-        except PermissionError:
+        except OSError:
+            # مفيش صلاحية أو الفولدر اتشال - نعرض اللي اتقرا
             pass
 
+        self._items_cache[self.current_path] = items
         return items
 
-    def draw(self):
+    def navigate(self, path: Path):
+        """الانتقال لمسار جديد وإلغاء كاش المسار القديم"""
+        self._items_cache.pop(self.current_path, None)
+        self.current_path = path
+        self._parent = None
+        self.current_idx = 0
+        self.scroll_offset = 0
+
+    def draw(self, items: List[Dict]):
         """رسم الواجهة"""
+        _begin_frame()
         self.stdscr.clear()
         height, width = self.stdscr.getmaxyx()
+        # أقصى عرض آمن - addnstr بيقص بدل ما يرمي curses.error
+        safe_w = max(0, width - 1)
+        if width != self._sep_width:
+            self._sep = "─" * width
+            self._sep_width = width
 
         # العنوان
         title = " File Browser - Navigate to your FCP projects folder "
-        self.stdscr.addstr(0, 0, title[:width-1], curses.color_pair(1) | curses.A_BOLD)
+        self.stdscr.addstr(0, 0, title[:width-1], C_CYAN_BOLD)
 
         # المسار الحالي
         path_str = f" {self.current_path} "
-        self.stdscr.addstr(1, 0, path_str[:width-1], curses.color_pair(2))
+        self.stdscr.addstr(1, 0, path_str[:width-1], C_GREEN)
 
         # خط فاصل
-        self.stdscr.addstr(2, 0, "─" * width)
-
-        # الحصول على العناصر
-        items = self.get_items()
+        self.stdscr.addstr(2, 0, self._sep)
 
         if not items:
-            self.stdscr.addstr(4, 2, "Empty directory or no permission", curses.color_pair(4))
+            self.stdscr.addstr(4, 2, "Empty directory or no permission", C_RED)
         else:
             visible_height = height - 6
 
@@ -147,9 +320,9 @@ class FileBrowser:
 
                 # اختيار اللون
                 if idx == self.current_idx:
-                    color = curses.color_pair(5) | curses.A_BOLD
+                    color = C_INV_BOLD
                 else:
-                    color = curses.A_NORMAL
+                    color = A_NORMAL
 
                 # الرمز
                 if item.get('is_parent'):
@@ -161,37 +334,31 @@ class FileBrowser:
 
                 line = f"{icon}{name}"
 
-                try:
-                    self.stdscr.addstr(3 + i, 2, line[:width-3], color)
-                except curses.error:
-                    pass
+                self.stdscr.addnstr(3 + i, 2, line, max(0, safe_w - 2), color)
 
         # خط فاصل
-        self.stdscr.addstr(height - 3, 0, "─" * width)
+        self.stdscr.addstr(height - 3, 0, self._sep)
 
         # التعليمات
         help_line = " ↑/↓:Navigate | ENTER:Open/Select | BACKSPACE:Back | s:Scan Here | q:Quit "
-        self.stdscr.addstr(height - 2, 0, help_line[:width-1], curses.color_pair(3))
+        self.stdscr.addstr(height - 2, 0, help_line[:width-1], C_YELLOW)
 
         self.stdscr.refresh()
+        _end_frame()
 
     def run(self) -> Path:
         """تشغيل المتصفح"""
-        items = self.get_items()
-
         while True:
-            self.draw()
             items = self.get_items()
+            self.draw(items)
 
             if not items:
                 key = self.stdscr.getch()
-                if key == ord('q') or key == ord('Q'):
+                if key in _KEYS_QUIT:
                     return None
-                elif key == curses.KEY_BACKSPACE or key == 127 or key == 8:
-                    if self.current_path != self.current_path.parent:
-                        self.current_path = self.current_path.parent
-                        self.current_idx = 0
-                        self.scroll_offset = 0
+                elif key in _KEYS_BACK:
+                    if self.current_path != self._get_parent():
+                        self.navigate(self._get_parent())
                 continue
 
             key = self.stdscr.getch()
@@ -204,26 +371,22 @@ class FileBrowser:
                 self.current_idx = min(len(items) - 1, self.current_idx + 1)
 
             # فتح / اختيار
-            elif key == ord('\n') or key == curses.KEY_ENTER or key == 10 or key == 13:
+            elif key in _KEYS_ENTER:
                 if 0 <= self.current_idx < len(items):
                     selected = items[self.current_idx]
-                    self.current_path = selected['path']
-                    self.current_idx = 0
-                    self.scroll_offset = 0
+                    self.navigate(Path(selected['path']))
 
             # الرجوع
-            elif key == curses.KEY_BACKSPACE or key == 127 or key == 8:
-                if self.current_path != self.current_path.parent:
-                    self.current_path = self.current_path.parent
-                    self.current_idx = 0
-                    self.scroll_offset = 0
+            elif key in _KEYS_BACK:
+                if self.current_path != self._get_parent():
+                    self.navigate(self._get_parent())
 
             # بدء المسح
-            elif key == ord('s') or key == ord('S'):
+            elif key in _KEYS_SCAN:
                 return self.current_path
 
             # الخروج
-            elif key == ord('q') or key == ord('Q'):
+            elif key in _KEYS_QUIT:
                 return None
 
 
@@ -235,7 +398,6 @@ class InteractiveCleaner:
         self.projects = projects
         self.current_idx = 0
         self.scroll_offset = 0
-        self.selected = set()
 
         self.items = []
         for project in projects:
@@ -249,35 +411,78 @@ class InteractiveCleaner:
                         'folder_ref': folder
                     })
 
-        curses.init_pair(1, curses.COLOR_CYAN, curses.COLOR_BLACK)
-        curses.init_pair(2, curses.COLOR_GREEN, curses.COLOR_BLACK)
-        curses.init_pair(3, curses.COLOR_YELLOW, curses.COLOR_BLACK)
-        curses.init_pair(4, curses.COLOR_RED, curses.COLOR_BLACK)
-        curses.init_pair(5, curses.COLOR_BLACK, curses.COLOR_WHITE)
+        # الأحجام والأسماء مش بتتغير بعد المسح - نجهزها مرة واحدة
+        for item in self.items:
+            item['size_str'] = format_size(item['size'])
+            item['display_name'] = f"{item['project_name']}/{item['folder_name']}"
+
+        # بايت لكل item (1 = محدد) - الفحص في الرسم index مباشر بدل hash
+        self.selected_mask = bytearray(len(self.items))
 
-        curses.curs_set(0)
+        # مجاميع شغالة - بتتحدث مع التحديد والمسح بدل sum كل فريم
+        self._total_size = sum(item['size'] for item in self.items)
+        self._selected_size = 0
+
+        # بيتحسب من أول وجديد بعد أي مسح
+        self._total_size_str = None
+
+        # حالة الرسم التفاضلي: صف -> (النص، اللون) من آخر فريم
+        self._prev_rendered = {}
+        self._screen_size = None
+        self._full_redraw = True
+
+        # نوافذ الرسائل - بتتعمل مرة واحدة وبيتعاد استخدامها
+        self._confirm_win = None
+        self._msg_win = None
+
+        # الخط الفاصل بيتبني بس لما العرض يتغير
+        self._sep_width = 0
+        self._sep = ""
 
     def get_total_size(self) -> int:
-        return sum(item['size'] for item in self.items)
+        return self._total_size
+
+    def get_selected_indices(self) -> List[int]:
+        return [i for i, b in enumerate(self.selected_mask) if b]
 
     def get_selected_size(self) -> int:
-        return sum(self.items[i]['size'] for i in self.selected)
+        return self._selected_size
 
     def draw(self):
-        self.stdscr.clear()
+        """رسم الواجهة - بيعيد رسم الصفوف اللي اتغيرت بس"""
+        _begin_frame()
         height, width = self.stdscr.getmaxyx()
-
-        title = " Final Cut Pro Cleaner "
-        self.stdscr.addstr(0, (width - len(title)) // 2, title,
-                          curses.color_pair(1) | curses.A_BOLD)
-
-        total_size = self.get_total_size()
+        # أقصى عرض آمن - addnstr بيقص بدل ما يرمي curses.error
+        safe_w = max(0, width - 1)
+        if width != self._sep_width:
+            self._sep = "─" * width
+            self._sep_width = width
+
+        # رسم كامل بس لو حجم الشاشة اتغير أو نافذة غطت الشاشة
+        if self._full_redraw or (height, width) != self._screen_size:
+            self.stdscr.erase()
+            self._prev_rendered = {}
+            self._screen_size = (height, width)
+            self._full_redraw = False
+
+            title = " Final Cut Pro Cleaner "
+            self.stdscr.addstr(0, (width - len(title)) // 2, title,
+                              C_CYAN_BOLD)
+
+            self.stdscr.addstr(2, 0, self._sep)
+            self.stdscr.addstr(height - 3, 0, self._sep)
+
+            help_text = " ↑/↓:Navigate | SPACE:Select | d:Delete | D:Delete All | b:Back | q:Quit "
+            self.stdscr.addstr(height - 2, 0, help_text, C_CYAN)
+
+        if self._total_size_str is None:
+            self._total_size_str = format_size(self.get_total_size())
         selected_size = self.get_selected_size()
 
-        info_line = f" Items: {len(self.items)} | Total: {format_size(total_size)} | Selected: {format_size(selected_size)} "
-        self.stdscr.addstr(1, 0, info_line, curses.color_pair(2))
-
-        self.stdscr.addstr(2, 0, "─" * width)
+        info_line = f" Items: {len(self.items)} | Total: {self._total_size_str} | Selected: {format_size(selected_size)} "
+        self.stdscr.move(1, 0)
+        self.stdscr.clrtoeol()
+        self.stdscr.addstr(1, 0, info_line, C_GREEN)
 
         visible_height = height - 6
 
@@ -288,50 +493,78 @@ class InteractiveCleaner:
 
         for i in range(visible_height):
             idx = i + self.scroll_offset
-            if idx >= len(self.items):
-                break
-
-            item = self.items[idx]
+            y = 3 + i
 
-            if idx == self.current_idx:
-                color = curses.color_pair(5) | curses.A_BOLD
-            elif idx in self.selected:
-                color = curses.color_pair(3)
+            if idx < len(self.items):
+                row = self._render_row(idx, width)
             else:
-                color = curses.A_NORMAL
+                row = None
 
-            mark = "[x]" if idx in self.selected else "[ ]"
-            name = f"{item['project_name']}/{item['folder_name']}"
-            size = format_size(item['size'])
+            # نفس النص ونفس اللون من الفريم اللي فات - مفيش داعي نكتبه تاني
+            if self._prev_rendered.get(y) == row:
+                continue
+            self._prev_rendered[y] = row
 
-            max_name_len = width - len(mark) - len(size) - 4
-            if len(name) > max_name_len:
-                name = name[:max_name_len - 3] + "..."
+            self.stdscr.move(y, 0)
+            self.stdscr.clrtoeol()
+            if row is None:
+                continue
 
-            line = f"{mark} {name}"
-            spaces = width - len(line) - len(size) - 2
-            line = line + " " * spaces + size
+            line, color = row
+            self.stdscr.addnstr(y, 0, line, safe_w, color)
 
-            try:
-                self.stdscr.addstr(3 + i, 0, line[:width-1], color)
-            except curses.error:
-                pass
+        self.stdscr.refresh()
+        _end_frame()
 
-        self.stdscr.addstr(height - 3, 0, "─" * width)
+    def _render_row(self, idx: int, width: int) -> Tuple[str, int]:
+        """تجهيز نص ولون صف واحد"""
+        item = self.items[idx]
 
-        help_text = " ↑/↓:Navigate | SPACE:Select | d:Delete | D:Delete All | b:Back | q:Quit "
-        self.stdscr.addstr(height - 2, 0, help_text, curses.color_pair(1))
+        if idx == self.current_idx:
+            color = C_INV_BOLD
+        elif self.selected_mask[idx]:
+            color = C_YELLOW
+        else:
+            color = A_NORMAL
 
-        self.stdscr.refresh()
+        mark = "[x]" if self.selected_mask[idx] else "[ ]"
+        name = item['display_name']
+        size = item['size_str']
+
+        max_name_len = width - len(mark) - len(size) - 4
+        if len(name) > max_name_len:
+            name = name[:max_name_len - 3] + "..."
+
+        # السطر كله في format واحد - الحشو بيتعمل جوه format spec
+        pad = max(0, max_name_len + 1)
+        return f"{mark} {name:<{pad}}{size}", color
+
+    def _reuse_win(self, win, h: int, w: int, y: int, x: int):
+        """إعادة استخدام نافذة موجودة (أو إنشاؤها أول مرة) بالمقاس والمكان المطلوبين"""
+        if win is None:
+            return curses.newwin(h, w, y, x)
+
+        try:
+            if win.getmaxyx() != (h, w):
+                win.resize(h, w)
+            if win.getbegyx() != (y, x):
+                win.mvwin(y, x)
+        except curses.error:
+            # المقاس الجديد مش بيتركب على المكان القديم - نافذة جديدة
+            return curses.newwin(h, w, y, x)
+
+        win.erase()
+        return win
 
     def confirm_delete(self, message: str) -> bool:
         """رسالة تأكيد واضحة مع خلفية سوداء كاملة"""
         height, width = self.stdscr.getmaxyx()
+        self._full_redraw = True
 
         # مسح الشاشة بالكامل - خلفية سوداء
         self.stdscr.clear()
-        self.stdscr.bkgd(' ', curses.color_pair(0))
-        self.stdscr.refresh()
+        self.stdscr.bkgd(' ', C_DEFAULT)
+        self.stdscr.noutrefresh()
 
         # رسم صندوق كبير في المنتصف
         confirm_h = 11
@@ -340,16 +573,18 @@ class InteractiveCleaner:
         start_x = (width - confirm_w) // 2
 
         # إنشاء نافذة للصندوق
-        confirm_win = curses.newwin(confirm_h, confirm_w, start_y, start_x)
+        confirm_win = self._reuse_win(self._confirm_win, confirm_h, confirm_w,
+                                      start_y, start_x)
+        self._confirm_win = confirm_win
 
         # تلوين الخلفية بالأحمر
-        confirm_win.bkgd(' ', curses.color_pair(4))
+        confirm_win.bkgd(' ', C_RED)
         confirm_win.box()
 
         # العنوان
         title = " CONFIRM DELETE "
         confirm_win.addstr(1, (confirm_w - len(title)) // 2, title,
-                          curses.color_pair(4) | curses.A_BOLD | curses.A_REVERSE)
+                          C_RED_BOLD | curses.A_REVERSE)
 
         # فراغ
         confirm_win.addstr(2, 2, " " * (confirm_w - 4))
@@ -361,7 +596,7 @@ class InteractiveCleaner:
         else:
             msg_part = message
 
-        confirm_win.addstr(4, (confirm_w - len(msg_part)) // 2, msg_part, curses.A_BOLD)
+        confirm_win.addstr(4, (confirm_w - len(msg_part)) // 2, msg_part, A_BOLD)
 
         # فراغ
         confirm_win.addstr(5, 2, " " * (confirm_w - 4))
@@ -371,27 +606,30 @@ class InteractiveCleaner:
         y_text = "Press 'y' to DELETE"
         n_text = "Press 'n' to CANCEL"
         confirm_win.addstr(7, (confirm_w - len(y_text)) // 2, y_text,
-                          curses.color_pair(4) | curses.A_BOLD)
+                          C_RED_BOLD)
         confirm_win.addstr(8, (confirm_w - len(n_text)) // 2, n_text,
-                          curses.color_pair(2) | curses.A_BOLD)
+                          C_GREEN_BOLD)
 
-        confirm_win.refresh()
+        # تحديث واحد للترمنال للشاشة والنافذة مع بعض
+        confirm_win.noutrefresh()
+        curses.doupdate()
 
         while True:
             key = confirm_win.getch()
-            if key == ord('y') or key == ord('Y'):
+            if key in _KEYS_YES:
                 return True
-            elif key == ord('n') or key == ord('N') or key == 27:
+            elif key in _KEYS_NO:
                 return False
 
     def show_message(self, message: str, duration: int = 2000):
         """رسالة واضحة بعد العملية مع خلفية سوداء"""
         height, width = self.stdscr.getmaxyx()
+        self._full_redraw = True
 
         # مسح الشاشة بالكامل - خلفية سوداء
         self.stdscr.clear()
-        self.stdscr.bkgd(' ', curses.color_pair(0))
-        self.stdscr.refresh()
+        self.stdscr.bkgd(' ', C_DEFAULT)
+        self.stdscr.noutrefresh()
 
         # رسم صندوق كبير
         msg_h = 7
@@ -399,46 +637,73 @@ class InteractiveCleaner:
         start_y = (height - msg_h) // 2
         start_x = (width - msg_w) // 2
 
-        msg_win = curses.newwin(msg_h, msg_w, start_y, start_x)
+        msg_win = self._reuse_win(self._msg_win, msg_h, msg_w, start_y, start_x)
+        self._msg_win = msg_win
 
         # تلوين الخلفية بالأخضر
-        msg_win.bkgd(' ', curses.color_pair(2))
+        msg_win.bkgd(' ', C_GREEN)
         msg_win.box()
 
         # الرسالة في المنتصف
         msg_win.addstr(3, (msg_w - len(message)) // 2, message,
-                      curses.color_pair(2) | curses.A_BOLD | curses.A_REVERSE)
+                      C_GREEN_BOLD | curses.A_REVERSE)
 
-        msg_win.refresh()
+        # تحديث واحد للترمنال للشاشة والنافذة مع بعض
+        msg_win.noutrefresh()
+        curses.doupdate()
 
         curses.napms(duration)
 
+    def _update_message(self, message: str):
+        """تغيير نص نافذة الرسالة المفتوحة من غير ما نمسح الشاشة تاني"""
+        msg_w = self._msg_win.getmaxyx()[1]
+        self._msg_win.addstr(3, (msg_w - len(message)) // 2, message,
+                             C_GREEN_BOLD | curses.A_REVERSE)
+        self._msg_win.refresh()
+
+    def _delete_items(self, items: List[Dict]) -> int:
+        """مسح مجموعة فولدرات بالتوازي مع عداد تقدم - يرجع عدد اللي اتمسح"""
+        total = len(items)
+        # العداد بعرض ثابت عشان النافذة متتغيرش مقاسها مع كل رقم
+        digits = len(str(total))
+        self.show_message(f"Deleting {0:>{digits}}/{total} folders...", 0)
+
+        deleted = 0
+        with ThreadPoolExecutor(max_workers=min(DELETE_WORKERS, total)) as executor:
+            futures = {executor.submit(delete_folder_safely, item['path']): item
+                       for item in items}
+            for done, future in enumerate(as_completed(futures), 1):
+                success, _ = future.result()
+                if success:
+                    futures[future]['folder_ref']['deleted'] = True
+                    deleted += 1
+                self._update_message(f"Deleting {done:>{digits}}/{total} folders...")
+
+        return deleted
+
     def delete_selected_items(self):
         """مسح كل الفولدرات المحددة"""
-        if not self.selected:
+        selected = self.get_selected_indices()
+        if not selected:
             self.show_message("No items selected!", 1000)
             return
 
-        count = len(self.selected)
-        total_size = sum(self.items[i]['size'] for i in self.selected)
-        size_str = format_size(total_size)
+        count = len(selected)
+        size_str = format_size(self._selected_size)
 
         if not self.confirm_delete(f"Delete {count} folders ({size_str})?"):
             return
 
         # المسح
-        deleted = 0
-        for idx in sorted(self.selected, reverse=True):
-            item = self.items[idx]
-            success, _ = delete_folder_safely(item['path'])
-            if success:
-                item['folder_ref']['deleted'] = True
-                deleted += 1
+        deleted = self._delete_items([self.items[idx] for idx in selected])
 
         # تحديث القائمة
-        self.items = [item for i, item in enumerate(self.items) if i not in self.selected]
-        self.selected.clear()
+        self.items = [item for i, item in enumerate(self.items) if not self.selected_mask[i]]
+        self.selected_mask = bytearray(len(self.items))
+        self._total_size -= self._selected_size
+        self._selected_size = 0
         self.current_idx = min(self.current_idx, len(self.items) - 1) if self.items else 0
+        self._total_size_str = None
 
         self.show_message(f"Deleted {deleted} folders!")
 
@@ -448,22 +713,24 @@ class InteractiveCleaner:
             return
 
         # لو فيه selected items - امسحهم
-        if self.selected:
+        if any(self.selected_mask):
             self.delete_selected_items()
             return
 
         # لو مفيش selected - امسح الـ current فقط
         item = self.items[self.current_idx]
-        size = format_size(item['size'])
 
-        if not self.confirm_delete(f"Delete {item['folder_name']} ({size})?"):
+        if not self.confirm_delete(f"Delete {item['folder_name']} ({item['size_str']})?"):
             return
 
         success, error_msg = delete_folder_safely(item['path'])
         if success:
             item['folder_ref']['deleted'] = True
             self.items.pop(self.current_idx)
+            del self.selected_mask[self.current_idx]
+            self._total_size -= item['size']
             self.current_idx = min(self.current_idx, len(self.items) - 1) if self.items else 0
+            self._total_size_str = None
             self.show_message("Deleted successfully!")
         else:
             self.show_message(f"Failed: {error_msg}", 2000)
@@ -478,16 +745,14 @@ class InteractiveCleaner:
         if not self.confirm_delete(f"Delete ALL {count} folders ({size})?"):
             return
 
-        deleted = 0
-        for item in self.items:
-            success, _ = delete_folder_safely(item['path'])
-            if success:
-                item['folder_ref']['deleted'] = True
-                deleted += 1
+        deleted = self._delete_items(self.items)
 
         self.items.clear()
-        self.selected.clear()
+        self.selected_mask = bytearray()
+        self._total_size = 0
+        self._selected_size = 0
         self.current_idx = 0
+        self._total_size_str = None
 
         self.show_message(f"Deleted {deleted} folders!")
 
@@ -502,28 +767,30 @@ class InteractiveCleaner:
 
                 # مسح الشاشة بالكامل - خلفية سوداء
                 self.stdscr.clear()
-                self.stdscr.bkgd(' ', curses.color_pair(0))
-                self.stdscr.refresh()
+                self.stdscr.bkgd(' ', C_DEFAULT)
+                self.stdscr.noutrefresh()
 
                 confirm_h = 13
                 confirm_w = min(70, width - 4)
                 start_y = (height - confirm_h) // 2
                 start_x = (width - confirm_w) // 2
 
-                msg_win = curses.newwin(confirm_h, confirm_w, start_y, start_x)
+                msg_win = self._reuse_win(self._msg_win, confirm_h, confirm_w,
+                                          start_y, start_x)
+                self._msg_win = msg_win
 
                 # تلوين الخلفية بالأخضر
-                msg_win.bkgd(' ', curses.color_pair(2))
+                msg_win.bkgd(' ', C_GREEN)
                 msg_win.box()
 
                 # العنوان
                 title = " ALL DONE! "
                 msg_win.addstr(2, (confirm_w - len(title)) // 2, title,
-                              curses.color_pair(2) | curses.A_BOLD | curses.A_REVERSE)
+                              C_GREEN_BOLD | curses.A_REVERSE)
 
                 # الرسالة
                 msg = "All cleanable folders processed."
-                msg_win.addstr(5, (confirm_w - len(msg)) // 2, msg, curses.A_BOLD)
+                msg_win.addstr(5, (confirm_w - len(msg)) // 2, msg, A_BOLD)
 
                 # فراغ
                 msg_win.addstr(6, 2, " " * (confirm_w - 4))
@@ -533,17 +800,19 @@ class InteractiveCleaner:
                 b_text = "Press 'b' to go back to browser"
                 q_text = "Press 'q' to quit program"
                 msg_win.addstr(8, (confirm_w - len(b_text)) // 2, b_text,
-                              curses.color_pair(3) | curses.A_BOLD)
+                              C_YELLOW_BOLD)
                 msg_win.addstr(9, (confirm_w - len(q_text)) // 2, q_text,
-                              curses.color_pair(4) | curses.A_BOLD)
+                              C_RED_BOLD)
 
-                msg_win.refresh()
+                # تحديث واحد للترمنال للشاشة والنافذة مع بعض
+                msg_win.noutrefresh()
+                curses.doupdate()
 
                 while True:
                     key = msg_win.getch()
-                    if key == ord('b') or key == ord('B'):
+                    if key in _KEYS_BROWSER:
                         return True  # رجوع للمتصفح
-                    elif key == ord('q') or key == ord('Q'):
+                    elif key in _KEYS_QUIT:
                         return False  # خروج
 
             # الحصول على input من المستخدم
@@ -554,103 +823,59 @@ class InteractiveCleaner:
                 self.current_idx = max(0, self.current_idx - 1)
             elif key == curses.KEY_DOWN:
                 self.current_idx = min(len(self.items) - 1, self.current_idx + 1)
-            elif key == ord(' ') or key == ord('\n'):
-                if self.current_idx in self.selected:
-                    self.selected.remove(self.current_idx)
+            elif key in _KEYS_TOGGLE:
+                self.selected_mask[self.current_idx] ^= 1
+                size = self.items[self.current_idx]['size']
+                if self.selected_mask[self.current_idx]:
+                    self._selected_size += size
                 else:
-                    self.selected.add(self.current_idx)
+                    self._selected_size -= size
             elif key == ord('d'):
                 self.delete_current()
             elif key == ord('D'):
                 self.delete_all()
-            elif key == ord('b') or key == ord('B'):
+            elif key in _KEYS_BROWSER:
                 return True  # رجوع للمتصفح
-            elif key == ord('q') or key == ord('Q'):
+            elif key in _KEYS_QUIT:
                 return False  # خروج نهائي
 
 
 def main(stdscr):
     """الدالة الرئيسية"""
-    # تهيئة الألوان
-    curses.init_pair(1, curses.COLOR_CYAN, curses.COLOR_BLACK)
-    curses.init_pair(2, curses.COLOR_GREEN, curses.COLOR_BLACK)
-    curses.init_pair(3, curses.COLOR_YELLOW, curses.COLOR_BLACK)
-    curses.init_pair(4, curses.COLOR_RED, curses.COLOR_BLACK)
+    # تهيئة الألوان والمؤشر - مرة واحدة للجلسة كلها
+    _init_colors()
 
     height, width = stdscr.getmaxyx()
 
     # عرض شاشة الترحيب مع اللوجو
     stdscr.clear()
 
-    # عرض اللوجو
-    logo = """
-     ------------------------------------------------------------
-   ----------------------------------------------------------------
-  ------------------------------------------------------------------
-  ------------------------------------------------------------------
-  --------##############----##############-----#############--------
-  --------##############----##############----##############--------
-  --------##############----##############----##############--------
-  --------##############----##############----##############--------
-  --------##############----##############----##############--------
-  --------##############----##############----##############--------
-  --------##############----##############----##############--------
-  --------##############----##############----##############--------
-  --------##############----##############----##############--------
-  --------##############----##############----##############--------
-  --------##############----##############----##############--------
-  --------##############----##############----##############--------
-  --------##############----##############----##############--------
-  --------##############----##############----##############--------
-  --------##############----##############----##############--------
-  --------##############----##############----##############--------
-  --------##############----##############----##############--------
-  --------##############----##############----##############--------
-  --------##############----##############----##############--------
-  --------##############----##############----##############--------
-  --------##############-----############*----##############--------
-  --------##############----------------------##############--------
-  --------##############----------------------##############--------
-  --------##############----------------------##############--------
-  --------##############----------------------##############--------
-  --------##############----------------------##############--------
-  --------##############----------------------##############--------
-  --------##############-----------------------#############--------
-  ------------------------------------------------------------------
-  ------------------------------------------------------------------
-   ----------------------------------------------------------------
-     ------------------------------------------------------------
-    """
 
-    logo_lines = logo.strip().split('\n')
-    start_y = max(0, (height - len(logo_lines) - 6) // 2)
+    start_y = max(0, (height - len(_LOGO_LINES) - 6) // 2)
+    # حافة شمال واحدة لكل السطور - الشكل يفضل زي ما هو
+    base_x = max(0, (width - _LOGO_MAXLEN) // 2)
 
     # عرض اللوجو
-    for i, line in enumerate(logo_lines):
+    for i, line in enumerate(_LOGO_LINES):
         if start_y + i < height - 4:
-            # مركز كل سطر
-            x_pos = max(0, (width - len(line)) // 2)
-            try:
-                stdscr.addstr(start_y + i, x_pos, line, curses.color_pair(1))
-            except curses.error:
-                pass
+            _safe_addstr(stdscr, start_y + i, base_x, line, C_CYAN)
 
     # عرض الرسائل تحت اللوجو
-    welcome_y = start_y + len(logo_lines) + 1
+    welcome_y = start_y + len(_LOGO_LINES) + 1
 
     welcome = "Welcome to Final Cut Pro Cleaner"
     if welcome_y < height - 3:
-        stdscr.addstr(welcome_y, max(0, (width - len(welcome)) // 2), welcome,
-                      curses.color_pair(1) | curses.A_BOLD)
+        _safe_addstr(stdscr, welcome_y, max(0, (width - len(welcome)) // 2), welcome,
+                     C_CYAN_BOLD)
 
     msg = "Navigate to your FCP projects folder..."
     if welcome_y + 1 < height - 2:
-        stdscr.addstr(welcome_y + 1, max(0, (width - len(msg)) // 2), msg)
+        _safe_addstr(stdscr, welcome_y + 1, max(0, (width - len(msg)) // 2), msg)
 
     msg2 = "Press any key to start"
     if welcome_y + 3 < height - 1:
-        stdscr.addstr(welcome_y + 3, max(0, (width - len(msg2)) // 2), msg2,
-                      curses.color_pair(2))
+        _safe_addstr(stdscr, welcome_y + 3, max(0, (width - len(msg2)) // 2), msg2,
+                     C_GREEN)
 
     stdscr.refresh()
     stdscr.getch()
@@ -696,35 +921,35 @@ def main(stdscr):
             start_x = (width - msg_w) // 2
 
             msg_win = curses.newwin(msg_h, msg_w, start_y, start_x)
-            msg_win.bkgd(' ', curses.color_pair(4))
+            msg_win.bkgd(' ', C_RED)
             msg_win.box()
 
             # العنوان
             title = " NO PROJECTS FOUND "
             msg_win.addstr(2, (msg_w - len(title)) // 2, title,
-                          curses.color_pair(4) | curses.A_BOLD | curses.A_REVERSE)
+                          C_RED_BOLD | curses.A_REVERSE)
 
             # الرسالة
             msg = "No .fcpbundle files in this location."
-            msg_win.addstr(5, (msg_w - len(msg)) // 2, msg, curses.A_BOLD)
+            msg_win.addstr(5, (msg_w - len(msg)) // 2, msg, A_BOLD)
 
             # الخيارات
-            msg_win.addstr(7, 4, "Press 'b' to go back", curses.color_pair(3) | curses.A_BOLD)
-            msg_win.addstr(8, 4, "Press 'q' to quit", curses.color_pair(4) | curses.A_BOLD)
+            msg_win.addstr(7, 4, "Press 'b' to go back", C_YELLOW_BOLD)
+            msg_win.addstr(8, 4, "Press 'q' to quit", C_RED_BOLD)
 
             msg_win.refresh()
 
             key = msg_win.getch()
-            if key == ord('b') or key == ord('B'):
+            if key in _KEYS_BROWSER:
                 continue  # رجوع للمتصفح
             else:
                 return  # خروج
 
-        projects = []
-        for bundle in bundles:
-            analysis = analyze_bundle(bundle)
-            if analysis['folders']:
-                projects.append(analysis)
+        # تحليل المشاريع بالتوازي - الوقت الكلي = أبطأ مشروع مش مجموعهم
+        with ThreadPoolExecutor(max_workers=SCAN_WORKERS) as executor:
+            analyses = list(executor.map(analyze_bundle, bundles))
+
+        projects = [analysis for analysis in analyses if analysis['folders']]
 
         if not projects:
             stdscr.clear()
@@ -736,28 +961,28 @@ def main(stdscr):
             start_x = (width - msg_w) // 2
 
             msg_win = curses.newwin(msg_h, msg_w, start_y, start_x)
-            msg_win.bkgd(' ', curses.color_pair(3))
+            msg_win.bkgd(' ', C_YELLOW)
             msg_win.box()
 
             # العنوان
             title = " NO CLEANABLE FOLDERS "
             msg_win.addstr(2, (msg_w - len(title)) // 2, title,
-                          curses.color_pair(3) | curses.A_BOLD | curses.A_REVERSE)
+                          C_YELLOW_BOLD | curses.A_REVERSE)
 
             # الرسالة
             msg1 = "No Analysis Files, Render Files, or Transcoded Media found."
             msg2 = "These projects are already clean!"
-            msg_win.addstr(5, (msg_w - len(msg1)) // 2, msg1, curses.A_BOLD)
-            msg_win.addstr(6, (msg_w - len(msg2)) // 2, msg2, curses.A_BOLD)
+            msg_win.addstr(5, (msg_w - len(msg1)) // 2, msg1, A_BOLD)
+            msg_win.addstr(6, (msg_w - len(msg2)) // 2, msg2, A_BOLD)
 
             # الخيارات
-            msg_win.addstr(9, 4, "Press 'b' to try another location", curses.color_pair(2) | curses.A_BOLD)
-            msg_win.addstr(10, 4, "Press 'q' to quit", curses.color_pair(4) | curses.A_BOLD)
+            msg_win.addstr(9, 4, "Press 'b' to try another location", C_GREEN_BOLD)
+            msg_win.addstr(10, 4, "Press 'q' to quit", C_RED_BOLD)
 
             msg_win.refresh()
 
             key = msg_win.getch()
-            if key == ord('b') or key == ord('B'):
+            if key in _KEYS_BROWSER:
                 continue  # رجوع للمتصفح
             else:
                 return  # خروج
@@ -16,18 +16,97 @@ import os
 import sys
 import curses
 import readline
-import glob
+import signal
+import textwrap
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 from typing import List, Dict
 
 # استيراد الوظائف المشتركة
 from fcp_common import (
     TARGET_FOLDERS,
+    TARGET_FOLDERS_SET,
     format_size,
     find_fcpbundles,
     delete_folder_safely
 )
 
+# عدد الـ threads لتحليل المشاريع - الشغل stat/scandir فالـ GIL بيتساب
+SCAN_WORKERS = 16
+
+# عدد الـ threads للمسح - rmtree بيسيب الـ GIL أثناء unlink
+DELETE_WORKERS = 8
+
+# اللوجو - بيتجهز مرة واحدة وقت تحميل الموديول
+_LOGO = """
+     ------------------------------------------------------------
+   ----------------------------------------------------------------
+  ------------------------------------------------------------------
+  ------------------------------------------------------------------
+  --------##############----##############-----#############--------
+  --------##############----##############----##############--------
+  --------##############----##############----##############--------
+  --------##############----##############----##############--------
+  --------##############----##############----##############--------
+  --------##############----##############----##############--------
+  --------##############----##############----##############--------
+  --------##############----##############----##############--------
+  --------##############----##############----##############--------
+  --------##############----##############----##############--------
+  --------##############----##############----##############--------
+  --------##############----##############----##############--------
+  --------##############----##############----##############--------
+  --------##############----##############----##############--------
+  --------##############----##############----##############--------
+  --------##############----##############----##############--------
+  --------##############----##############----##############--------
+  --------##############----##############----##############--------
+  --------##############----##############----##############--------
+  --------##############----##############----##############--------
+  --------##############-----############*----##############--------
+  --------##############----------------------##############--------
+  --------##############----------------------##############--------
+  --------##############----------------------##############--------
+  --------##############----------------------##############--------
+  --------##############----------------------##############--------
+  --------##############----------------------##############--------
+  --------##############-----------------------#############--------
+  ------------------------------------------------------------------
+  ------------------------------------------------------------------
+   ----------------------------------------------------------------
+     ------------------------------------------------------------
+    """
+_LOGO_LINES = tuple(textwrap.dedent(_LOGO).strip('\n').split('\n'))
+_LOGO_MAXLEN = max(len(line) for line in _LOGO_LINES)
+
+# attributes جاهزة - بتتملى مرة واحدة في _init_colors()
+ATTR_NORMAL = curses.A_NORMAL
+ATTR_TITLE = ATTR_ACCENT = ATTR_INFO = ATTR_SUCCESS = 0
+ATTR_CURRENT = ATTR_SELECTED = ATTR_HINT = ATTR_DANGER = 0
+
+
+def _init_colors():
+    """تهيئة ألوان الترمنال مرة واحدة وحساب الـ attributes"""
+    global ATTR_TITLE, ATTR_ACCENT, ATTR_INFO, ATTR_SUCCESS
+    global ATTR_CURRENT, ATTR_SELECTED, ATTR_HINT, ATTR_DANGER
+
+    curses.init_pair(1, curses.COLOR_CYAN, curses.COLOR_BLACK)
+    curses.init_pair(2, curses.COLOR_GREEN, curses.COLOR_BLACK)
+    curses.init_pair(3, curses.COLOR_YELLOW, curses.COLOR_BLACK)
+    curses.init_pair(4, curses.COLOR_RED, curses.COLOR_BLACK)
+    curses.init_pair(5, curses.COLOR_BLACK, curses.COLOR_WHITE)
+
+    ATTR_TITLE = curses.color_pair(1) | curses.A_BOLD
+    ATTR_ACCENT = curses.color_pair(1)
+    ATTR_INFO = curses.color_pair(2)
+    ATTR_SUCCESS = curses.color_pair(2) | curses.A_BOLD
+    ATTR_CURRENT = curses.color_pair(5) | curses.A_BOLD
+    ATTR_SELECTED = curses.color_pair(3)
+    ATTR_HINT = curses.color_pair(3)
+    ATTR_DANGER = curses.color_pair(4) | curses.A_BOLD
+
+    curses.curs_set(0)  # إخفاء المؤشر
+
 
 def analyze_bundle(bundle_path: Path) -> Dict:
     """
@@ -45,28 +124,48 @@ def analyze_bundle(bundle_path: Path) -> Dict:
     date_folders = find_date_folders(bundle_path)
 
     for date_folder in date_folders:
+        # قراءة فولدر التاريخ مرة واحدة بدل exists() لكل target
+        try:
+            with os.scandir(date_folder) as it:
+                present = {entry.name: entry.path for entry in it
+                           if entry.name in TARGET_FOLDERS_SET and entry.is_dir(follow_symlinks=False)}
+        except OSError:
+            continue
+
+        # مفيش ولا فولدر مستهدف - نعدي على طول
+        if not present:
+            continue
+
         for target_folder in TARGET_FOLDERS:
-            folder_path = date_folder / target_folder
-            if folder_path.exists():
-                size = get_folder_size(folder_path)
-                if size > 0:
-                    result['folders'].append({
-                        'name': f"{date_folder.name}/{target_folder}",
-                        'path': folder_path,
-                        'size': size,
-                        'deleted': False
-                    })
+            if target_folder not in present:
+                continue
+
+            size = get_folder_size(present[target_folder])
+            if size > 0:
+                result['folders'].append({
+                    'name': f"{date_folder.name}/{target_folder}",
+                    'path': Path(present[target_folder]),
+                    'size': size,
+                    'deleted': False
+                })
 
     return result
 
 
+def _safe_addstr(win, y: int, x: int, text: str, attr: int = 0):
+    """كتابة نص مقصوص على حدود النافذة - آخر عمود مش بيتلمس فمفيش curses.error"""
+    max_y, max_x = win.getmaxyx()
+    if y >= max_y or x >= max_x - 1:
+        return
+    win.addnstr(y, x, text, max_x - x - 1, attr)
+
+
 class InteractiveCleaner:
     def __init__(self, stdscr, projects: List[Dict]):
         self.stdscr = stdscr
         self.projects = projects
         self.current_idx = 0
         self.scroll_offset = 0
-        self.selected = set()
 
         # تجميع كل الفولدرات في قائمة واحدة
         self.items = []
@@ -78,45 +177,86 @@ class InteractiveCleaner:
                         'folder_name': folder['name'],
                         'path': folder['path'],
                         'size': folder['size'],
+                        'size_str': format_size(folder['size']),  # الحجم مش بيتغير - نجهزه مرة
+                        'display_name': f"{project['bundle_name']}/{folder['name']}",
+                        'selected': False,  # التحديد جوه الـ item - مش بيتأثر بالمسح
                         'folder_ref': folder  # reference للتحديث
                     })
 
-        # إعدادات الألوان
-        curses.init_pair(1, curses.COLOR_CYAN, curses.COLOR_BLACK)
-        curses.init_pair(2, curses.COLOR_GREEN, curses.COLOR_BLACK)
-        curses.init_pair(3, curses.COLOR_YELLOW, curses.COLOR_BLACK)
-        curses.init_pair(4, curses.COLOR_RED, curses.COLOR_BLACK)
-        curses.init_pair(5, curses.COLOR_BLACK, curses.COLOR_WHITE)
+        # مجاميع شغالة - بتتحدث مع التحديد والمسح بدل sum كل فريم
+        self._total_size = sum(item['size'] for item in self.items)
+        self._selected_size = 0
+        self._selected_count = 0
+        # آخر (عدد، إجمالي، محدد) اتكتب في سطر المعلومات
+        self._info_state = None
 
-        curses.curs_set(0)  # إخفاء المؤشر
+        # فيه حاجة اتغيرت ومحتاجة draw()
+        self._dirty = True
 
-    def get_total_size(self) -> int:
-        """حساب المساحة الإجمالية"""
-        return sum(item['size'] for item in self.items)
+        # حالة آخر فريم - عشان نرسم الصفوف اللي اتغيرت بس
+        self._prev_idx = None
+        self._screen_size = None
+        self._full_redraw = True
 
-    def get_selected_size(self) -> int:
-        """حساب مساحة المحدد"""
-        return sum(self.items[i]['size'] for i in self.selected)
+        # pad فيه كل الصفوف مرة واحدة - التمرير مجرد تغيير للـ viewport
+        self._pad = None
+        self._pad_dirty = True
 
-    def draw(self):
-        """رسم الواجهة"""
+        # كاش لنص الصفوف: (idx, محدد؟) -> السطر - بيتمسح مع تغيير العرض أو القائمة
+        self._row_cache = {}
+        self._cache_width = 0
+
+        # الأسماء بعد القص - list موازية للـ items بتتبني لما العرض يتغير
+        self._trunc = []
+        self._truncation_width = None
+
+        # مقاس الترمنال - بيتقرا تاني بس مع KEY_RESIZE
+        self._height, self._width = self.stdscr.getmaxyx()
+
+    def _update_size(self):
+        """قراءة المقاس الجديد بعد KEY_RESIZE"""
+        self._height, self._width = self.stdscr.getmaxyx()
+        # بعد تغيير المقاس الترمنال ممكن يكون متلخبط - مسح كامل مرة واحدة بس
         self.stdscr.clear()
-        height, width = self.stdscr.getmaxyx()
+        self._invalidate_rows()
+
+    def _invalidate_rows(self):
+        """القائمة أو العرض اتغير - الصفوف والـ pad يتبنوا من جديد"""
+        self._row_cache.clear()
+        self._truncation_width = None
+        self._pad_dirty = True
+        self._full_redraw = True
+
+    def _rebuild_truncated(self, width: int):
+        """قص أسماء كل الـ items مرة واحدة على العرض الحالي"""
+        self._trunc = []
+        for item in self.items:
+            name = item['display_name']
+            # "[ ]" + المسافات + الحجم
+            max_name_len = width - 3 - len(item['size_str']) - 4
+            if len(name) > max_name_len:
+                name = name[:max_name_len - 3] + "..."
+            self._trunc.append(name)
+        self._truncation_width = width
 
-        # العنوان
-        title = " Final Cut Pro Cleaner "
-        self.stdscr.addstr(0, (width - len(title)) // 2, title,
-                          curses.color_pair(1) | curses.A_BOLD)
+    def _build_pad(self, width: int):
+        """رسم كل الصفوف في pad جديد بعرض الشاشة"""
+        self._pad = curses.newpad(max(1, len(self.items)), width)
+        for idx in range(len(self.items)):
+            self._draw_row(idx, width)
+        self._pad_dirty = False
 
-        # المعلومات
-        total_size = self.get_total_size()
-        selected_size = self.get_selected_size()
+    def get_total_size(self) -> int:
+        """المساحة الإجمالية"""
+        return self._total_size
 
-        info_line = f" Items: {len(self.items)} | Total: {format_size(total_size)} | Selected: {format_size(selected_size)} "
-        self.stdscr.addstr(1, 0, info_line, curses.color_pair(2))
+    def get_selected_size(self) -> int:
+        """مساحة المحدد"""
+        return self._selected_size
 
-        # خط فاصل
-        self.stdscr.addstr(2, 0, "─" * width)
+    def draw(self):
+        """رسم الواجهة - رسم كامل بس لما يلزم، وإلا الصفوف اللي اتغيرت"""
+        height, width = self._height, self._width
 
         # عرض الفولدرات
         visible_height = height - 6
@@ -127,56 +267,118 @@ class InteractiveCleaner:
         elif self.current_idx >= self.scroll_offset + visible_height:
             self.scroll_offset = self.current_idx - visible_height + 1
 
-        for i in range(visible_height):
-            idx = i + self.scroll_offset
-            if idx >= len(self.items):
-                break
+        # رسم كامل لو الشاشة اتغيرت أو نافذة غطتها أو اتمسح حاجة من القائمة
+        if self._full_redraw or (height, width) != self._screen_size:
+            self.stdscr.erase()
 
-            item = self.items[idx]
+            # العنوان
+            title = " Final Cut Pro Cleaner "
+            _safe_addstr(self.stdscr, 0, max(0, (width - len(title)) // 2), title,
+                         ATTR_TITLE)
 
-            # تحديد اللون
-            if idx == self.current_idx:
-                color = curses.color_pair(5) | curses.A_BOLD
-            elif idx in self.selected:
-                color = curses.color_pair(3)
-            else:
-                color = curses.A_NORMAL
+            # الخطوط الفاصلة بعرض الشاشة بالظبط - مش في آخر سطر فمفيش scroll
+            if height > 5:
+                self.stdscr.addstr(2, 0, "─" * width)
+                self.stdscr.addstr(height - 3, 0, "─" * width)
 
-            # رمز التحديد
-            mark = "[x]" if idx in self.selected else "[ ]"
+            # التعليمات
+            help_text = " ↑/↓:Navigate | SPACE:Select | d:Delete | D:Delete All | q:Quit "
+            if height > 4:
+                _safe_addstr(self.stdscr, height - 2, 0, help_text, ATTR_ACCENT)
 
-            # اسم المشروع والفولدر
-            name = f"{item['project_name']}/{item['folder_name']}"
-            size = format_size(item['size'])
+            if self._pad_dirty or (height, width) != self._screen_size:
+                self._build_pad(width)
+            else:
+                # الـ pad سليم - بس لازم يتنسخ تاني فوق اللي النافذة غطته
+                self._pad.touchwin()
+
+            self._full_redraw = False
+            self._screen_size = (height, width)
+            self._info_state = None
+        elif self._prev_idx != self.current_idx:
+            # المؤشر اتحرك بس - النص زي ما هو، نغير الـ attributes للصفين
+            if self._prev_idx < len(self.items):
+                self._highlight(self._prev_idx, self._row_attr(self._prev_idx), width)
+            self._highlight(self.current_idx, ATTR_CURRENT, width)
+        else:
+            # نفس الصف (تحديد/إلغاء) - النص نفسه اتغير
+            self._draw_row(self.current_idx, width)
+
+        self._prev_idx = self.current_idx
+
+        # المعلومات - بتتكتب بس لما العدد أو المجاميع تتغير
+        info_state = (len(self.items), self._total_size, self._selected_size)
+        if info_state != self._info_state:
+            self._info_state = info_state
+            info_line = f" Items: {info_state[0]} | Total: {format_size(info_state[1])} | Selected: {format_size(info_state[2])} "
+            self.stdscr.move(1, 0)
+            self.stdscr.clrtoeol()
+            _safe_addstr(self.stdscr, 1, 0, info_line, ATTR_INFO)
+
+        # curses بيحسب أقل output للترمنال في doupdate واحد
+        self.stdscr.noutrefresh()
+        if visible_height > 0:
+            # الجزء الظاهر من الـ pad حسب الـ scroll
+            self._pad.noutrefresh(self.scroll_offset, 0, 3, 0, height - 4, width - 1)
+        curses.doupdate()
+
+    def _row_attr(self, idx: int) -> int:
+        """لون الصف حسب المؤشر والتحديد"""
+        if idx == self.current_idx:
+            return ATTR_CURRENT
+        if self.items[idx]['selected']:
+            return ATTR_SELECTED
+        return ATTR_NORMAL
+
+    def _highlight(self, idx: int, attr: int, width: int):
+        """تغيير لون صف موجود في الـ pad من غير ما نعيد كتابة النص"""
+        pad_h, pad_w = self._pad.getmaxyx()
+        if idx < 0 or idx >= min(len(self.items), pad_h):
+            return
+        # السطر المتنسق طوله width - 2 (شوف _draw_row) - جوه عرض الـ pad
+        length = min(width - 2, pad_w - 1)
+        if length > 0:
+            self._pad.chgat(idx, 0, length, attr)
+
+    def _draw_row(self, idx: int, width: int):
+        """رسم صف واحد في مكانه في الـ pad (سطر لكل item)"""
+        if idx < 0 or idx >= len(self.items):
+            return
 
-            # قص النص إذا كان طويل
-            max_name_len = width - len(mark) - len(size) - 4
-            if len(name) > max_name_len:
-                name = name[:max_name_len - 3] + "..."
+        item = self.items[idx]
 
-            line = f"{mark} {name}"
+        color = self._row_attr(idx)
 
-            # إضافة المساحة في النهاية
-            spaces = width - len(line) - len(size) - 2
-            line = line + " " * spaces + size
+        if width != self._cache_width:
+            self._row_cache.clear()
+            self._cache_width = width
 
-            try:
-                self.stdscr.addstr(3 + i, 0, line[:width-1], color)
-            except curses.error:
-                pass
+        key = (idx, item['selected'])
+        line = self._row_cache.get(key)
+        if line is None:
+            # رمز التحديد
+            mark = "[x]" if key[1] else "[ ]"
 
-        # خط فاصل
-        self.stdscr.addstr(height - 3, 0, "─" * width)
+            # اسم المشروع والفولدر بعد القص
+            if width != self._truncation_width:
+                self._rebuild_truncated(width)
+            name = self._trunc[idx]
+            size = item['size_str']
 
-        # التعليمات
-        help_text = " ↑/↓:Navigate | SPACE:Select | d:Delete | D:Delete All | q:Quit "
-        self.stdscr.addstr(height - 2, 0, help_text, curses.color_pair(1))
+            # السطر كله في format واحد - المسافات بتتعمل جوه format spec
+            pad = max(0, width - len(mark) - 1 - len(name) - len(size) - 2)
+            line = f"{mark} {name}{'':{pad}}{size}"
+            self._row_cache[key] = line
 
-        self.stdscr.refresh()
+        self._pad.move(idx, 0)
+        self._pad.clrtoeol()
+        _safe_addstr(self._pad, idx, 0, line, color)
 
-    def confirm_delete(self, message: str) -> bool:
-        """طلب تأكيد المسح"""
-        height, width = self.stdscr.getmaxyx()
+    def _draw_confirm(self, message: str):
+        """رسم نافذة التأكيد في نص الشاشة بالمقاس الحالي"""
+        height, width = self._height, self._width
+        # النافذة بتغطي جزء من القائمة - الفريم الجاي لازم يكون كامل
+        self._full_redraw = True
 
         # رسم نافذة التأكيد
         confirm_h = 7
@@ -189,56 +391,83 @@ class InteractiveCleaner:
         confirm_win.box()
 
         # النص
-        confirm_win.addstr(1, 2, "Confirm Delete", curses.color_pair(4) | curses.A_BOLD)
+        confirm_win.addstr(1, 2, "Confirm Delete", ATTR_DANGER)
         confirm_win.addstr(3, 2, message[:confirm_w - 4])
-        confirm_win.addstr(5, 2, "Press 'y' to confirm, 'n' to cancel", curses.color_pair(3))
+        confirm_win.addstr(5, 2, "Press 'y' to confirm, 'n' to cancel", ATTR_HINT)
 
         confirm_win.refresh()
 
+    def confirm_delete(self, message: str) -> bool:
+        """طلب تأكيد المسح"""
+        self._draw_confirm(message)
+
         # انتظار الرد
         while True:
             key = self.stdscr.getch()
-            if key == ord('y') or key == ord('Y'):
+            if key == curses.KEY_RESIZE:
+                # المقاس الجديد مسح الشاشة - القائمة والنافذة يترسموا تاني
+                self._update_size()
+                self.draw()
+                self._draw_confirm(message)
+            elif key == ord('y') or key == ord('Y'):
                 return True
             elif key == ord('n') or key == ord('N') or key == 27:  # ESC
                 return False
 
     def show_message(self, message: str, duration: int = 2000):
         """عرض رسالة مؤقتة"""
-        height, width = self.stdscr.getmaxyx()
+        height, width = self._height, self._width
+        self._full_redraw = True
 
         msg_win = curses.newwin(5, min(len(message) + 4, width - 4),
                                 (height - 5) // 2, (width - min(len(message) + 4, width - 4)) // 2)
         msg_win.box()
-        msg_win.addstr(2, 2, message[:width - 8], curses.color_pair(2) | curses.A_BOLD)
+        msg_win.addstr(2, 2, message[:width - 8], ATTR_SUCCESS)
         msg_win.refresh()
 
         curses.napms(duration)
 
+    def _delete_items(self, items: List[Dict]) -> int:
+        """مسح مجموعة فولدرات بالتوازي مع عداد تقدم - يرجع عدد اللي اتمسح"""
+        total = len(items)
+        # العداد بعرض ثابت عشان النافذة متتغيرش مقاسها مع كل رقم
+        digits = len(str(total))
+        self.show_message(f"Deleting {0:>{digits}}/{total} folders...", 0)
+
+        deleted = 0
+        with ThreadPoolExecutor(max_workers=min(DELETE_WORKERS, total)) as executor:
+            futures = {executor.submit(delete_folder_safely, item['path']): item
+                       for item in items}
+            for done, future in enumerate(as_completed(futures), 1):
+                success, _ = future.result()
+                if success:
+                    futures[future]['folder_ref']['deleted'] = True
+                    deleted += 1
+                self.show_message(f"Deleting {done:>{digits}}/{total} folders...", 0)
+
+        return deleted
+
     def delete_selected(self):
         """مسح الفولدرات المحددة"""
-        if not self.selected:
+        if not self._selected_count:
             self.show_message("No items selected!", 1000)
             return
 
-        count = len(self.selected)
+        count = self._selected_count
         size = format_size(self.get_selected_size())
 
         if not self.confirm_delete(f"Delete {count} folders ({size})?"):
             return
 
         # المسح
-        deleted = 0
-        for idx in sorted(self.selected, reverse=True):
-            item = self.items[idx]
-            success, _ = delete_folder_safely(item['path'])
-            if success:
-                item['folder_ref']['deleted'] = True
-                deleted += 1
+        deleted = self._delete_items([item for item in self.items if item['selected']])
 
         # تحديث القائمة
-        self.items = [item for i, item in enumerate(self.items) if i not in self.selected]
-        self.selected.clear()
+        self.items = [item for item in self.items if not item['selected']]
+        self._total_size -= self._selected_size
+        self._selected_size = 0
+        self._selected_count = 0
+        self._invalidate_rows()
         self.current_idx = min(self.current_idx, len(self.items) - 1)
 
         self.show_message(f"Deleted {deleted} folders!")
@@ -249,15 +478,18 @@ class InteractiveCleaner:
             return
 
         item = self.items[self.current_idx]
-        size = format_size(item['size'])
-
-        if not self.confirm_delete(f"Delete {item['folder_name']} ({size})?"):
+        if not self.confirm_delete(f"Delete {item['folder_name']} ({item['size_str']})?"):
             return
 
         success, error_msg = delete_folder_safely(item['path'])
         if success:
             item['folder_ref']['deleted'] = True
             self.items.pop(self.current_idx)
+            self._total_size -= item['size']
+            if item['selected']:
+                self._selected_size -= item['size']
+                self._selected_count -= 1
+            self._invalidate_rows()
             self.current_idx = min(self.current_idx, len(self.items) - 1)
             self.show_message("Deleted successfully!")
         else:
@@ -274,23 +506,46 @@ class InteractiveCleaner:
         if not self.confirm_delete(f"Delete ALL {count} folders ({size})?"):
             return
 
-        deleted = 0
-        for item in self.items:
-            success, _ = delete_folder_safely(item['path'])
-            if success:
-                item['folder_ref']['deleted'] = True
-                deleted += 1
+        deleted = self._delete_items(self.items)
 
         self.items.clear()
-        self.selected.clear()
+        self._total_size = 0
+        self._selected_size = 0
+        self._selected_count = 0
+        self._invalidate_rows()
         self.current_idx = 0
 
         self.show_message(f"Deleted {deleted} folders!")
 
+    def _read_arrow_delta(self, key: int) -> int:
+        """سحب كل الأسهم المستنية في الـ input وإرجاع مجموع الحركة"""
+        delta = -1 if key == curses.KEY_UP else 1
+
+        self.stdscr.nodelay(True)
+        try:
+            while True:
+                next_key = self.stdscr.getch()
+                if next_key == curses.KEY_UP:
+                    delta -= 1
+                elif next_key == curses.KEY_DOWN:
+                    delta += 1
+                else:
+                    # أي مفتاح تاني يرجع للـ queue ويتنفذ لوحده
+                    if next_key != -1:
+                        curses.ungetch(next_key)
+                    break
+        finally:
+            self.stdscr.nodelay(False)
+
+        return delta
+
     def run(self):
         """تشغيل الواجهة التفاعلية"""
         while True:
-            self.draw()
+            # مفتاح ملوش لازمة مش بيعمل فريم جديد
+            if self._dirty:
+                self.draw()
+                self._dirty = False
 
             if not self.items:
                 self.show_message("All done! Press any key to exit.", 3000)
@@ -299,24 +554,37 @@ class InteractiveCleaner:
 
             key = self.stdscr.getch()
 
-            # التنقل
-            if key == curses.KEY_UP:
-                self.current_idx = max(0, self.current_idx - 1)
-            elif key == curses.KEY_DOWN:
-                self.current_idx = min(len(self.items) - 1, self.current_idx + 1)
+            if key == curses.KEY_RESIZE:
+                self._update_size()
+                self._dirty = True
+
+            # التنقل - الأسهم المتراكمة (زرار مضغوط) بتتجمع في خطوة ورسمة واحدة
+            elif key == curses.KEY_UP or key == curses.KEY_DOWN:
+                delta = self._read_arrow_delta(key)
+                new_idx = max(0, min(len(self.items) - 1, self.current_idx + delta))
+                if new_idx != self.current_idx:
+                    self.current_idx = new_idx
+                    self._dirty = True
 
             # التحديد
             elif key == ord(' ') or key == ord('\n'):
-                if self.current_idx in self.selected:
-                    self.selected.remove(self.current_idx)
+                item = self.items[self.current_idx]
+                item['selected'] = not item['selected']
+                if item['selected']:
+                    self._selected_size += item['size']
+                    self._selected_count += 1
                 else:
-                    self.selected.add(self.current_idx)
+                    self._selected_size -= item['size']
+                    self._selected_count -= 1
+                self._dirty = True
 
-            # المسح
+            # المسح (حتى لو اتلغى، نافذة التأكيد غطت الشاشة)
             elif key == ord('d'):
                 self.delete_current()
+                self._dirty = True
             elif key == ord('D'):
                 self.delete_all()
+                self._dirty = True
 
             # الخروج
             elif key == ord('q') or key == ord('Q'):
@@ -325,63 +593,23 @@ class InteractiveCleaner:
 
 def main(stdscr, root_path: Path):
     """الدالة الرئيسية"""
+    _init_colors()
     stdscr.clear()
     height, width = stdscr.getmaxyx()
 
-    # عرض اللوجو أولاً
-    logo = """
-     ------------------------------------------------------------
-   ----------------------------------------------------------------
-  ------------------------------------------------------------------
-  ------------------------------------------------------------------
-  --------##############----##############-----#############--------
-  --------##############----##############----##############--------
-  --------##############----##############----##############--------
-  --------##############----##############----##############--------
-  --------##############----##############----##############--------
-  --------##############----##############----##############--------
-  --------##############----##############----##############--------
-  --------##############----##############----##############--------
-  --------##############----##############----##############--------
-  --------##############----##############----##############--------
-  --------##############----##############----##############--------
-  --------##############----##############----##############--------
-  --------##############----##############----##############--------
-  --------##############----##############----##############--------
-  --------##############----##############----##############--------
-  --------##############----##############----##############--------
-  --------##############----##############----##############--------
-  --------##############----##############----##############--------
-  --------##############----##############----##############--------
-  --------##############----##############----##############--------
-  --------##############-----############*----##############--------
-  --------##############----------------------##############--------
-  --------##############----------------------##############--------
-  --------##############----------------------##############--------
-  --------##############----------------------##############--------
-  --------##############----------------------##############--------
-  --------##############----------------------##############--------
-  --------##############-----------------------#############--------
-  ------------------------------------------------------------------
-  ------------------------------------------------------------------
-   ----------------------------------------------------------------
-     ------------------------------------------------------------
-    """
 
-    logo_lines = logo.strip().split('\n')
-    start_y = max(0, (height - len(logo_lines) - 8) // 2)
+    # عرض اللوجو أولاً
+    start_y = max(0, (height - len(_LOGO_LINES) - 8) // 2)
+    # حافة شمال واحدة لكل السطور - الشكل يفضل زي ما هو
+    base_x = max(0, (width - _LOGO_MAXLEN) // 2)
 
     # عرض اللوجو
-    for i, line in enumerate(logo_lines):
+    for i, line in enumerate(_LOGO_LINES):
         if start_y + i < height - 6:
-            x_pos = max(0, (width - len(line)) // 2)
-            try:
-                stdscr.addstr(start_y + i, x_pos, line, curses.color_pair(1))
-            except curses.error:
-                pass
+            _safe_addstr(stdscr, start_y + i, base_x, line, ATTR_ACCENT)
 
     # عرض رسائل التحميل تحت اللوجو
-    loading_y = start_y + len(logo_lines) + 2
+    loading_y = start_y + len(_LOGO_LINES) + 2
 
     loading_msgs = [
         "Searching for .fcpbundle files...",
@@ -398,7 +626,7 @@ def main(stdscr, root_path: Path):
     bundles = find_fcpbundles(root_path)
 
     if not bundles:
-        stdscr.clear()
+        stdscr.erase()
         msg = "No .fcpbundle files found!"
         stdscr.addstr(height // 2, (width - len(msg)) // 2, msg)
         stdscr.addstr(height // 2 + 2, (width - 25) // 2, "Press any key to exit...")
@@ -406,14 +634,27 @@ def main(stdscr, root_path: Path):
         stdscr.getch()
         return
 
-    projects = []
-    for bundle in bundles:
-        analysis = analyze_bundle(bundle)
-        if analysis['folders']:
-            projects.append(analysis)
+    # تحليل المشاريع بالتوازي مع تحديث العداد كل ما مشروع يخلص
+    analyses = [None] * len(bundles)
+    progress_y = loading_y + 1
+    with ThreadPoolExecutor(max_workers=min(SCAN_WORKERS, len(bundles))) as executor:
+        futures = {executor.submit(analyze_bundle, bundle): i
+                   for i, bundle in enumerate(bundles)}
+        for done, future in enumerate(as_completed(futures), 1):
+            analyses[futures[future]] = future.result()
+
+            if progress_y < height - 1:
+                msg = f"Analyzing projects... {done}/{len(bundles)}"
+                stdscr.move(progress_y, 0)
+                stdscr.clrtoeol()
+                stdscr.addstr(progress_y, max(0, (width - len(msg)) // 2), msg)
+                stdscr.refresh()
+
+    # نفس ترتيب الـ bundles الأصلي
+    projects = [analysis for analysis in analyses if analysis['folders']]
 
     if not projects:
-        stdscr.clear()
+        stdscr.erase()
         msg = "No cleanable folders found!"
         stdscr.addstr(height // 2, (width - len(msg)) // 2, msg)
         stdscr.addstr(height // 2 + 2, (width - 25) // 2, "Press any key to exit...")
@@ -426,29 +667,81 @@ def main(stdscr, root_path: Path):
     cleaner.run()
 
 
-def path_completer(text, state):
-    """Tab completion للمسارات"""
+# نتايج آخر Tab - readline بينادي الدالة بـ state = 0, 1, 2 ... لنفس النص
+_completion_text = None
+_completion_matches = []
+
+
+def _list_path_matches(text: str) -> List[str]:
+    """المسارات اللي بتبدأ بالنص - قراءة واحدة للفولدر بـ scandir"""
     # توسيع ~ إلى المسار الكامل
-    text = os.path.expanduser(text)
+    path = os.path.expanduser(text)
 
-    # إضافة * للبحث
-    if os.path.isdir(text):
-        text = os.path.join(text, '*')
+    # لو فولدر - نعرض اللي جواه، غير كده نكمل الاسم في الفولدر الأب
+    if os.path.isdir(path):
+        parent, prefix = path, ''
     else:
-        text = text + '*'
+        parent, prefix = os.path.split(path)
+
+    matches = []
+    try:
+        with os.scandir(parent or '.') as entries:
+            for entry in entries:
+                name = entry.name
+                if not name.startswith(prefix):
+                    continue
+                # زي glob: الملفات المخفية بتظهر بس لو النص نفسه بيبدأ بنقطة
+                if name.startswith('.') and not prefix.startswith('.'):
+                    continue
+
+                # إضافة / للفولدرات (is_dir من نوع الـ entry من غير stat)
+                full_path = os.path.join(parent, name)
+                matches.append(full_path + '/' if entry.is_dir() else full_path)
+    except OSError:
+        pass
 
-    # البحث عن المطابقات
-    matches = glob.glob(text)
+    return matches
+
+
+def path_completer(text, state):
+    """Tab completion للمسارات"""
+    global _completion_text, _completion_matches
 
-    # إضافة / للفولدرات
-    matches = [f + '/' if os.path.isdir(f) else f for f in matches]
+    # البحث مرة واحدة لكل Tab - باقي الـ states من الكاش
+    if state == 0 or text != _completion_text:
+        _completion_text = text
+        _completion_matches = _list_path_matches(text)
 
     try:
-        return matches[state]
+        return _completion_matches[state]
     except IndexError:
         return None
 
 
+# المسارات اللي اتحلت قبل كده: النص المكتوب -> Path
+_path_cache = {}
+
+
+def resolve_input_path(path_input: str) -> Path:
+    """تحويل النص المكتوب لمسار مطلق - resolve بس لما يلزم"""
+    cached = _path_cache.get(path_input)
+    if cached is not None:
+        return cached
+
+    # توسيع المسار (دعم ~ و .)
+    expanded = os.path.expanduser(path_input)
+
+    # المسار المطلق من غير symlink أو .. مش محتاج realpath (lstat لكل جزء)
+    if (os.path.isabs(expanded) and '..' not in Path(expanded).parts
+            and not os.path.islink(expanded)):
+        root_path = Path(expanded)
+    else:
+        root_path = Path(expanded).resolve()
+
+    _path_cache[path_input] = root_path
+    return root_path
+
+
 def setup_readline():
     """إعداد readline للـ tab completion"""
     # تفعيل tab completion
@@ -463,7 +756,7 @@ if __name__ == "__main__":
 
     # طلب المسار من المستخدم
     if len(sys.argv) > 1:
-        root_path = Path(sys.argv[1]).expanduser().resolve()
+        root_path = resolve_input_path(sys.argv[1])
     else:
         print("\n" + "=" * 60)
         print("🎬 Final Cut Pro Bundle Cleaner")
@@ -502,8 +795,7 @@ if __name__ == "__main__":
                 # استخراج المسار بعد cd
                 path_input = path_input[3:].strip()
 
-            # توسيع المسار (دعم ~ و .)
-            root_path = Path(path_input).expanduser().resolve()
+            root_path = resolve_input_path(path_input)
 
             if root_path.exists():
                 break
@@ -525,6 +817,14 @@ if __name__ == "__main__":
 
     print(f"\n✓ Scanning: {root_path}\n")
 
+    # GNU readline بيصدّر LINES/COLUMNS للـ environment وبياخد SIGWINCH -
+    # curses لو لقاهم بيثبت المقاس ومش بيركب handler فـ KEY_RESIZE مش بيغير حاجة
+    for name in ('LINES', 'COLUMNS'):
+        os.environ.pop(name, None)
+        os.unsetenv(name)
+    if hasattr(signal, 'SIGWINCH'):
+        signal.signal(signal.SIGWINCH, signal.SIG_DFL)
+
     # تشغيل الواجهة
     try:
         curses.wrapper(main, root_path)
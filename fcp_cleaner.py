@@ -6,11 +6,12 @@ Final Cut Pro Bundle Cleaner
 من مشاريع Final Cut Pro للباك أب
 
 الاستخدام:
-    python3 fcp_cleaner.py [المسار] [--auto] [--dry-run]
+    python3 fcp_cleaner.py [المسار] [--auto] [--dry-run] [--trash]
 
 الخيارات:
     --auto      مسح تلقائي لكل الفولدرات بدون تأكيد
     --dry-run   عرض التقرير فقط بدون مسح
+    --trash     نقل الفولدرات لسلة المهملات بدل المسح النهائي
 
 إذا لم تحدد مسار، سيستخدم المجلد الحالي
 
@@ -18,8 +19,9 @@ Final Cut Pro Bundle Cleaner
 """
 
 import sys
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
-from typing import List, Dict
+from typing import List, Dict, Tuple, Iterator, Optional
 
 # استيراد الوظائف المشتركة
 from fcp_common import (
@@ -27,17 +29,32 @@ from fcp_common import (
     format_size,
     find_fcpbundles,
     analyze_bundle,
-    delete_folder_safely
+    delete_folder_safely,
+    ScanProgress
 )
 
+# عدد الـ threads لتحليل المشاريع - APFS بيسلسل قراءة الفولدرات على نفس الـ volume
+# فأكتر من 4 مش بيفرق
+SCAN_WORKERS = 4
 
-def print_analysis(projects: List[Dict]):
-    """طباعة تقرير التحليل"""
-    print("\n" + "="*70)
-    print("📊 تقرير تحليل مشاريع Final Cut Pro")
-    print("="*70 + "\n")
+# عدد الـ threads للمسح - rmtree بيسيب الـ GIL أثناء unlink
+DELETE_WORKERS = 8
+
+# ردود التأكيد المقبولة
+_YES = frozenset({'yes', 'y', 'نعم'})
+_NO = frozenset({'no', 'n', 'لا'})
+
+
+def print_analysis(projects: List[Dict], total_cleanable: int):
+    """طباعة تقرير التحليل (الإجمالي جاي جاهز من ScanProgress)"""
+    # التقرير كله بيتجمع ويتكتب مرة واحدة بدل print لكل سطر
+    lines = []
+    add = lines.append
+
+    add("\n" + "="*70)
+    add("📊 تقرير تحليل مشاريع Final Cut Pro")
+    add("="*70 + "\n")
 
-    total_cleanable = 0
     project_count = 0
 
     for idx, project in enumerate(projects, 1):
@@ -45,40 +62,64 @@ def print_analysis(projects: List[Dict]):
             continue
 
         project_count += 1
-        print(f"[{idx}] المشروع: {project['bundle_name']}")
-        print(f"    المسار: {project['bundle_path']}")
+        add(f"[{idx}] المشروع: {project['bundle_name']}")
+        add(f"    المسار: {project['bundle_path']}")
 
         for date_folder in project['date_folders']:
-            print(f"\n    📁 التاريخ: {date_folder['date_name']}")
+            add(f"\n    📁 التاريخ: {date_folder['date_name']}")
 
             for folder_name, info in date_folder['folders'].items():
                 size_str = format_size(info['size'])
-                print(f"       • {folder_name}: {size_str}")
-                total_cleanable += info['size']
+                add(f"       • {folder_name}: {size_str}")
 
-        print(f"\n    💾 إجمالي قابل للمسح: {format_size(project['cleanable_size'])}")
-        print("    " + "─"*60)
+        add(f"\n    💾 إجمالي قابل للمسح: {format_size(project['cleanable_size'])}")
+        add("    " + "─"*60)
 
-    print("\n" + "="*70)
-    print(f"📦 إجمالي المشاريع التي تحتوي على ملفات قابلة للمسح: {project_count}")
-    print(f"🗑️  إجمالي المساحة القابلة للتوفير: {format_size(total_cleanable)}")
-    print("="*70 + "\n")
+    add("\n" + "="*70)
+    add(f"📦 إجمالي المشاريع التي تحتوي على ملفات قابلة للمسح: {project_count}")
+    add(f"🗑️  إجمالي المساحة القابلة للتوفير: {format_size(total_cleanable)}")
+    add("="*70 + "\n")
+
+    sys.stdout.write("\n".join(lines) + "\n")
+
+
+def _delete_folders(folders: List[Tuple[str, Dict]],
+                    trash: bool = False) -> Iterator[Tuple[Tuple[str, Dict], bool, str]]:
+    """
+    مسح مجموعة فولدرات بالتوازي
+
+    Args:
+        folders: قائمة (اسم الفولدر, info فيه path و size)
+        trash: نقل لسلة المهملات بدل المسح
+
+    Yields:
+        ((اسم الفولدر, info), نجح/فشل, رسالة الخطأ) بترتيب الانتهاء
+    """
+    if not folders:
+        return
+
+    with ThreadPoolExecutor(max_workers=min(DELETE_WORKERS, len(folders))) as executor:
+        futures = {executor.submit(delete_folder_safely, info['path'], info.get('files'), trash): (name, info)
+                   for name, info in folders}
+        for future in as_completed(futures):
+            success, error_msg = future.result()
+            yield futures[future], success, error_msg
 
 
 def confirm_deletion(message: str) -> bool:
     """طلب تأكيد من المستخدم"""
     while True:
         response = input(f"{message} (yes/no): ").lower().strip()
-        if response in ['yes', 'y', 'نعم']:
+        if response in _YES:
             return True
-        elif response in ['no', 'n', 'لا']:
+        elif response in _NO:
             return False
         print("⚠️  من فضلك أدخل yes أو no")
 
 
 
 
-def interactive_menu(projects: List[Dict]):
+def interactive_menu(projects: List[Dict], total_cleanable: int, trash: bool = False):
     """القائمة التفاعلية للمسح"""
     # فلترة المشاريع التي تحتوي على ملفات قابلة للمسح
     cleanable_projects = [p for p in projects if p['cleanable_size'] > 0]
@@ -105,22 +146,22 @@ def interactive_menu(projects: List[Dict]):
             break
 
         elif choice == '1':
-            delete_specific_folder(cleanable_projects)
+            delete_specific_folder(cleanable_projects, trash)
 
         elif choice == '2':
-            delete_project_folders(cleanable_projects)
+            delete_project_folders(cleanable_projects, trash)
 
         elif choice == '3':
-            delete_all_folders(cleanable_projects)
+            delete_all_folders(cleanable_projects, total_size=total_cleanable, trash=trash)
 
         elif choice == '4':
-            print_analysis(projects)
+            print_analysis(projects, total_cleanable)
 
         else:
             print("⚠️  اختيار غير صحيح!")
 
 
-def delete_specific_folder(projects: List[Dict]):
+def delete_specific_folder(projects: List[Dict], trash: bool = False):
     """مسح فولدر معين من مشروع معين"""
     print("\n📋 المشاريع المتاحة:")
     for idx, project in enumerate(projects, 1):
@@ -144,7 +185,8 @@ def delete_specific_folder(projects: List[Dict]):
             all_folders.append({
                 'name': f"{date_folder['date_name']}/{folder_name}",
                 'path': info['path'],
-                'size': info['size']
+                'size': info['size'],
+                'files': info.get('files')
             })
 
     print("\n📁 الفولدرات المتاحة:")
@@ -164,14 +206,14 @@ def delete_specific_folder(projects: List[Dict]):
 
     if confirm_deletion(f"⚠️  هل أنت متأكد من مسح {folder['name']}؟"):
         print(f"🗑️  جاري المسح...")
-        success, error_msg = delete_folder_safely(folder['path'])
+        success, error_msg = delete_folder_safely(folder['path'], folder['files'], trash)
         if success:
             print(f"✅ تم المسح بنجاح! تم توفير {format_size(folder['size'])}")
         else:
             print(f"❌ فشل المسح: {error_msg}")
 
 
-def delete_project_folders(projects: List[Dict]):
+def delete_project_folders(projects: List[Dict], trash: bool = False):
     """مسح كل الفولدرات الكبيرة من مشروع معين"""
     print("\n📋 المشاريع المتاحة:")
     for idx, project in enumerate(projects, 1):
@@ -199,23 +241,27 @@ def delete_project_folders(projects: List[Dict]):
         deleted_count = 0
         total_freed = 0
 
-        for date_folder in project['date_folders']:
-            for folder_name, info in date_folder['folders'].items():
-                print(f"🗑️  جاري مسح {folder_name}...")
-                success, error_msg = delete_folder_safely(info['path'])
-                if success:
-                    deleted_count += 1
-                    total_freed += info['size']
-                    print(f"   ✅ تم")
-                else:
-                    print(f"   ❌ فشل: {error_msg}")
+        folders = [(f"{date_folder['date_name']}/{folder_name}", info)
+                   for date_folder in project['date_folders']
+                   for folder_name, info in date_folder['folders'].items()]
+
+        print(f"🗑️  جاري مسح {len(folders)} فولدر...")
+        for (folder_name, info), success, error_msg in _delete_folders(folders, trash):
+            if success:
+                deleted_count += 1
+                total_freed += info['size']
+                print(f"   ✅ {folder_name}")
+            else:
+                print(f"   ❌ {folder_name}: {error_msg}")
 
         print(f"\n✅ تم مسح {deleted_count} فولدر! تم توفير {format_size(total_freed)}")
 
 
-def delete_all_folders(projects: List[Dict], skip_confirm: bool = False):
+def delete_all_folders(projects: List[Dict], skip_confirm: bool = False,
+                       total_size: Optional[int] = None, trash: bool = False):
     """مسح كل الفولدرات الكبيرة من كل المشاريع"""
-    total_size = sum(p['cleanable_size'] for p in projects)
+    if total_size is None:
+        total_size = sum(p['cleanable_size'] for p in projects)
 
     print(f"\n⚠️  سيتم مسح كل الفولدرات الكبيرة من {len(projects)} مشروع")
     print(f"💾 إجمالي المساحة التي سيتم توفيرها: {format_size(total_size)}")
@@ -238,16 +284,17 @@ def delete_all_folders(projects: List[Dict], skip_confirm: bool = False):
     for project in projects:
         print(f"\n📦 معالجة: {project['bundle_name']}")
 
-        for date_folder in project['date_folders']:
-            for folder_name, info in date_folder['folders'].items():
-                print(f"   🗑️  مسح {folder_name}...")
-                success, error_msg = delete_folder_safely(info['path'])
-                if success:
-                    deleted_count += 1
-                    total_freed += info['size']
-                    print(f"      ✅ تم")
-                else:
-                    print(f"      ❌ فشل: {error_msg}")
+        folders = [(f"{date_folder['date_name']}/{folder_name}", info)
+                   for date_folder in project['date_folders']
+                   for folder_name, info in date_folder['folders'].items()]
+
+        for (folder_name, info), success, error_msg in _delete_folders(folders, trash):
+            if success:
+                deleted_count += 1
+                total_freed += info['size']
+                print(f"   ✅ {folder_name}")
+            else:
+                print(f"   ❌ {folder_name}: {error_msg}")
 
     print(f"\n🎉 اكتمل! تم مسح {deleted_count} فولدر من {len(projects)} مشروع")
     print(f"💾 تم توفير: {format_size(total_freed)}")
@@ -303,6 +350,7 @@ def main():
     args = sys.argv[1:]
     auto_mode = '--auto' in args
     dry_run = '--dry-run' in args
+    trash = '--trash' in args
 
     # إزالة الـ flags من الـ args
     path_args = [arg for arg in args if not arg.startswith('--')]
@@ -324,6 +372,9 @@ def main():
     elif auto_mode:
         print("⚡ الوضع التلقائي - سيتم المسح بدون تأكيد")
 
+    if trash and not dry_run:
+        print("🗑️  الفولدرات هتتنقل لسلة المهملات (~/.Trash) بدل المسح النهائي")
+
     print("🔍 جاري البحث عن مشاريع Final Cut Pro...")
 
     # البحث عن المشاريع
@@ -336,14 +387,23 @@ def main():
     print(f"✅ تم العثور على {len(bundles)} مشروع\n")
     print("⏳ جاري تحليل المشاريع...")
 
-    # تحليل المشاريع
-    projects = []
-    for bundle in bundles:
-        analysis = analyze_bundle(bundle)
-        projects.append(analysis)
+    progress = ScanProgress()
+
+    # قايمة الملفات للمسح السريع بس لما المسح أكيد هيحصل (--auto)، مش في
+    # المعاينة ولا القائمة التفاعلية، ولا مع --trash (rename واحد)
+    collect_files = auto_mode and not dry_run and not trash
+
+    def analyze(bundle: Path) -> Dict:
+        project = analyze_bundle(bundle, collect_files=collect_files)
+        progress.update_bundle_analyzed(project['total_size'], project['cleanable_size'])
+        return project
+
+    # تحليل المشاريع بالتوازي - map بيحافظ على الترتيب
+    with ThreadPoolExecutor(max_workers=SCAN_WORKERS) as executor:
+        projects = list(executor.map(analyze, bundles))
 
     # عرض التقرير
-    print_analysis(projects)
+    print_analysis(projects, progress.total_cleanable)
 
     # اختيار الوضع
     if dry_run:
@@ -353,12 +413,13 @@ def main():
         # مسح تلقائي
         cleanable_projects = [p for p in projects if p['cleanable_size'] > 0]
         if cleanable_projects:
-            delete_all_folders(cleanable_projects, skip_confirm=True)
+            delete_all_folders(cleanable_projects, skip_confirm=True,
+                               total_size=progress.total_cleanable, trash=trash)
         else:
             print("\n✅ لا توجد ملفات قابلة للمسح!")
     else:
         # القائمة التفاعلية
-        interactive_menu(projects)
+        interactive_menu(projects, progress.total_cleanable, trash)
 
 
 if __name__ == "__main__":
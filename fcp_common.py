@@ -13,9 +13,15 @@ Final Cut Pro Bundle Cleaner - Common Functions
 """
 
 import os
+import sys
+import errno
+import uuid
 import shutil
+import functools
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
-from typing import List, Dict, Tuple, Optional
+from typing import List, Dict, Tuple, Optional, Union
 from datetime import datetime
 
 
@@ -26,32 +32,109 @@ TARGET_FOLDERS = [
     "Transcoded Media"
 ]
 
+# نفس الفولدرات كـ set للـ membership السريع
+TARGET_FOLDERS_SET = frozenset(TARGET_FOLDERS)
 
+# عدد الـ threads لحساب فولدرات الـ bundle الواحد (واحد لكل target)
+TARGET_WORKERS = 3
+
+# حد أقصى لعمليات حساب الحجم الشغالة في نفس الوقت في البرنامج كله
+# (مع pool المشاريع + pool الـ targets) - أكتر من كده بيزود الزحمة على الـ volume
+_SIZE_SLOTS = threading.BoundedSemaphore(4)
+
+# الملف اللي بيميز فولدر التاريخ (الـ event) - أسماء الفولدرات نفسها حرة
+EVENT_MARKER = "CurrentVersion.fcpevent"
+
+# أقصى عدد ملفات نحتفظ بقايمتهم من التحليل للمسح في التشغيلة كلها (مش لكل
+# فولدر) - اللي بعد كده بيتمسح بـ rmtree العادي
+FILE_CACHE_LIMIT = 200_000
+
+# الباقي من FILE_CACHE_LIMIT - threads التحليل بتحجز منه تحت الـ lock
+_file_budget = FILE_CACHE_LIMIT
+_file_budget_lock = threading.Lock()
+
+# فتح فولدر من غير ما نمشي ورا symlink (O_NOFOLLOW) - أساس المسح بالـ inode
+_DIR_OPEN_FLAGS = os.O_RDONLY | getattr(os, 'O_DIRECTORY', 0) | getattr(os, 'O_NOFOLLOW', 0)
+_UNLINK_BY_FD = (os.open in os.supports_dir_fd and os.unlink in os.supports_dir_fd
+                 and hasattr(os, 'O_NOFOLLOW'))
+
+
+# وحدات الأحجام - كل واحدة 1024 من اللي قبلها
+_UNITS = ('B', 'KB', 'MB', 'GB', 'TB', 'PB')
+
+
+@functools.lru_cache(maxsize=16384)
 def format_size(size_bytes: int) -> str:
     """
     تحويل الحجم من بايت إلى وحدة قابلة للقراءة
 
+    النتيجة بتتخزن - الأحجام مش بتتغير بعد المسح فنفس الرقم بيترسم كتير
+
     Args:
         size_bytes: الحجم بالبايت
 
     Returns:
         نص منسق (مثل: "1.5 GB")
     """
-    for unit in ['B', 'KB', 'MB', 'GB', 'TB']:
-        if size_bytes < 1024.0:
-            return f"{size_bytes:.1f} {unit}"
-        size_bytes /= 1024.0
-    return f"{size_bytes:.1f} PB"
+    # كل وحدة = 10 bits - الـ index من bit_length مباشرة من غير loop
+    idx = min((max(int(size_bytes), 1).bit_length() - 1) // 10, len(_UNITS) - 1)
+    return f"{size_bytes / (1 << (idx * 10)):.1f} {_UNITS[idx]}"
 
 
-def get_folder_size(folder_path: Path, progress_callback=None) -> int:
+def _iter_file_entries(folder_path: Union[Path, str], all_files: bool = False):
+    """
+    الملفات العادية (غير المخفية) تحت الفولدر كـ DirEntry - المشي الوحيد
+    للشجرة في البرنامج (الحجم والعدد والمسح كلهم عليه)
+
+    os.scandir بـ stack بدل recursion: getdents واحد لكل فولدر،
+    ونوع العنصر جاي مع الـ entry فمفيش stat للفولدرات خالص
+
+    all_files: كل اللي os.walk بيحطه في filenames - المخفي والـ symlinks
+    والملفات الخاصة كمان (ماعدا symlink لفولدر)
+    """
+    stack = [os.fspath(folder_path)]
+
+    while stack:
+        try:
+            with os.scandir(stack.pop()) as entries:
+                for entry in entries:
+                    # تخطي الملفات والفولدرات المخفية
+                    if not all_files and entry.name.startswith('.'):
+                        continue
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            stack.append(entry.path)
+                        elif entry.is_file(follow_symlinks=False):
+                            # symlinks والملفات الخاصة مش بتشغل مساحة بيانات
+                            yield entry
+                        elif all_files and not entry.is_dir():
+                            yield entry
+                    except OSError:
+                        # ملف محذوف أو مش موجود - تخطيه
+                        continue
+        except OSError:
+            # مفيش صلاحية - نكمل باللي قدرنا نحسبه
+            continue
+
+
+def _iter_files(folder_path: Union[Path, str]):
+    """الملفات تحت الفولدر واحد واحد: (entry, الحجم) - lstat من غير follow"""
+    for entry in _iter_file_entries(folder_path):
+        try:
+            yield entry, entry.stat(follow_symlinks=False).st_size
+        except OSError:
+            # ملف محذوف أو مش موجود - تخطيه
+            continue
+
+
+def get_folder_size(folder_path: Union[Path, str], progress_callback=None) -> int:
     """
     حساب حجم الفولدر بالبايت (محسّن للأداء)
 
-    استخدام os.walk() بدلاً من rglob() - أسرع بكثير!
+    استخدام os.scandir() بدلاً من rglob() - أسرع بكثير!
 
     Args:
-        folder_path: مسار الفولدر
+        folder_path: مسار الفولدر (Path أو str - بيتحول لـ str مرة واحدة)
         progress_callback: دالة اختيارية لتتبع التقدم (للـ UI)
 
     Returns:
@@ -61,26 +144,13 @@ def get_folder_size(folder_path: Path, progress_callback=None) -> int:
     file_count = 0
 
     try:
-        for dirpath, dirnames, filenames in os.walk(folder_path):
-            # تخطي المجلدات المخفية
-            dirnames[:] = [d for d in dirnames if not d.startswith('.')]
-
-            for filename in filenames:
-                if filename.startswith('.'):
-                    continue
-
-                try:
-                    filepath = os.path.join(dirpath, filename)
-                    total += os.path.getsize(filepath)
-                    file_count += 1
+        for _, size in _iter_files(folder_path):
+            total += size
+            file_count += 1
 
-                    # تحديث progress كل 100 ملف
-                    if progress_callback and file_count % 100 == 0:
-                        progress_callback(file_count, total)
-
-                except (OSError, FileNotFoundError):
-                    # ملف محذوف أو مش موجود - تخطيه
-                    continue
+            # تحديث progress كل 100 ملف
+            if progress_callback and file_count % 100 == 0:
+                progress_callback(file_count, total)
 
     except (PermissionError, OSError):
         # مفيش صلاحية - نرجع اللي قدرنا نحسبه
@@ -101,19 +171,38 @@ def find_fcpbundles(root_path: Path, progress_callback=None) -> List[Path]:
         قائمة بمسارات الـ bundles (مرتبة أبجدياً)
     """
     bundles = []
+    # strings جوه اللوب - Path بس للنتايج
+    stack = [os.fspath(root_path)]
 
-    try:
-        for item in root_path.rglob("*.fcpbundle"):
-            if item.is_dir():
-                bundles.append(item)
-                if progress_callback:
-                    progress_callback(item)
-
-    except (PermissionError, OSError) as e:
-        # في حالة عدم القدرة على الوصول
-        pass
-
-    return sorted(bundles)
+    while stack:
+        try:
+            with os.scandir(stack.pop()) as entries:
+                for entry in entries:
+                    # تخطي الفولدرات المخفية
+                    if entry.name.startswith('.'):
+                        continue
+                    try:
+                        if not entry.is_dir(follow_symlinks=False):
+                            continue
+                    except OSError:
+                        continue
+
+                    if entry.name.endswith('.fcpbundle'):
+                        # الـ bundle نفسه مش بننزل جواه - فيه آلاف ملفات الـ render
+                        bundle = Path(entry.path)
+                        bundles.append(bundle)
+                        if progress_callback:
+                            progress_callback(bundle)
+                    else:
+                        stack.append(entry.path)
+
+        except (PermissionError, OSError):
+            # في حالة عدم القدرة على الوصول - نكمل الباقي
+            continue
+
+    # ترتيب في نفس القايمة من غير نسخة تانية
+    bundles.sort()
+    return bundles
 
 
 def find_date_folders(bundle_path: Path) -> List[Path]:
@@ -131,14 +220,17 @@ def find_date_folders(bundle_path: Path) -> List[Path]:
     date_folders = []
 
     try:
-        for item in bundle_path.iterdir():
-            # تخطي الملفات والفولدرات المخفية
-            if not item.is_dir() or item.name.startswith('.'):
-                continue
+        # scandir بيرجع نوع الـ entry من غير stat إضافي لكل عنصر
+        with os.scandir(bundle_path) as entries:
+            for entry in entries:
+                # تخطي الملفات والفولدرات المخفية
+                if entry.name.startswith('.') or not entry.is_dir(follow_symlinks=False):
+                    continue
 
-            # التحقق من وجود CurrentVersion.fcpevent
-            if (item / "CurrentVersion.fcpevent").exists():
-                date_folders.append(item)
+                # التحقق من وجود CurrentVersion.fcpevent - access(F_OK) من غير
+                # ما نبني stat_result زي exists()
+                if os.access(os.path.join(entry.path, EVENT_MARKER), os.F_OK):
+                    date_folders.append(Path(entry.path))
 
     except (PermissionError, OSError):
         pass
@@ -146,13 +238,16 @@ def find_date_folders(bundle_path: Path) -> List[Path]:
     return date_folders
 
 
-def analyze_bundle(bundle_path: Path, progress_callback=None) -> Dict:
+def analyze_bundle(bundle_path: Path, progress_callback=None,
+                   collect_files: bool = False) -> Dict:
     """
     تحليل bundle واحد واكتشاف الفولدرات القابلة للمسح
 
     Args:
         bundle_path: مسار الـ .fcpbundle
         progress_callback: دالة اختيارية للتحديث
+        collect_files: الاحتفاظ بقايمة ملفات كل target لـ delete_folder_safely -
+                       بس لما المسح أكيد هيحصل (ضمن FILE_CACHE_LIMIT)
 
     Returns:
         قاموس يحتوي على:
@@ -171,48 +266,255 @@ def analyze_bundle(bundle_path: Path, progress_callback=None) -> Dict:
     }
 
     date_folders = find_date_folders(bundle_path)
+    if not date_folders:
+        return result
+
+    # الـ 3 targets بيتحسبوا مع بعض - كل واحد في جزء مختلف من الـ volume
+    with ThreadPoolExecutor(max_workers=TARGET_WORKERS) as executor:
+        for date_folder in date_folders:
+            date_info = {
+                'date_name': date_folder.name,
+                'folders': {}
+            }
+
+            # قراءة فولدر التاريخ مرة واحدة بدل exists() لكل target
+            try:
+                with os.scandir(date_folder) as entries:
+                    children = {entry.name: entry.path for entry in entries
+                                if entry.name in TARGET_FOLDERS_SET
+                                and entry.is_dir(follow_symlinks=False)}
+            except OSError:
+                continue
 
-    for date_folder in date_folders:
-        date_info = {
-            'date_name': date_folder.name,
-            'folders': {}
-        }
+            # event من غير أي target (اتنضف قبل كده) - مفيش حاجة نحسبها
+            if not children:
+                continue
 
-        for target_folder in TARGET_FOLDERS:
-            folder_path = date_folder / target_folder
+            futures = {}
+            for target_folder in TARGET_FOLDERS:
+                if target_folder in children:
+                    if progress_callback:
+                        progress_callback(f"Analyzing {target_folder}...")
 
-            if folder_path.exists():
-                if progress_callback:
-                    progress_callback(f"Analyzing {target_folder}...")
+                    future = executor.submit(_scan_target, children[target_folder],
+                                             collect_files)
+                    futures[future] = target_folder
 
-                size = get_folder_size(folder_path)
+            scans = {}
+            for future in as_completed(futures):
+                scans[futures[future]] = future.result()
 
+            # نفس ترتيب TARGET_FOLDERS في التقرير
+            for target_folder in TARGET_FOLDERS:
+                size, files = scans.get(target_folder, (0, None))
                 if size > 0:
                     date_info['folders'][target_folder] = {
-                        'path': folder_path,
-                        'size': size
+                        'path': date_folder / target_folder,
+                        'size': size,
+                        'files': files
                     }
                     result['cleanable_size'] += size
 
-        # فقط أضف date_folder لو فيه حاجة قابلة للمسح
-        if date_info['folders']:
-            result['date_folders'].append(date_info)
+            # فقط أضف date_folder لو فيه حاجة قابلة للمسح
+            if date_info['folders']:
+                result['date_folders'].append(date_info)
 
     return result
 
 
-def delete_folder_safely(folder_path: Path) -> Tuple[bool, str]:
+def _scan_target(folder_path: Union[Path, str],
+                 collect_files: bool = False) -> Tuple[int, Optional[List[Tuple[int, str]]]]:
+    """
+    حجم فولدر target + (لو مطلوب) قايمة ملفاته (inode, المسار النسبي)
+    عشان المسح ميمشيش الشجرة تاني
+
+    جوه الحد العام للعمليات المتوازية. القايمة None لو مش مطلوبة أو لو
+    الملفات أكبر من الباقي في FILE_CACHE_LIMIT - inode() جاي من getdents
+    فمش بيكلف stat زيادة
+    """
+    global _file_budget
+
+    root = os.fspath(folder_path)
+    # entry.path = root + sep + المسار النسبي
+    prefix_len = len(os.path.join(root, ''))
+    total = 0
+    # الحد المحلي من الباقي وقت البداية - الحجز الفعلي تحت الـ lock في الآخر
+    limit = _file_budget if collect_files else 0
+    files = [] if limit > 0 else None
+
+    with _SIZE_SLOTS:
+        try:
+            for entry, size in _iter_files(root):
+                total += size
+                if files is not None:
+                    if len(files) < limit:
+                        files.append((entry.inode(), entry.path[prefix_len:]))
+                    else:
+                        files = None
+        except OSError:
+            # مفيش صلاحية - نرجع اللي قدرنا نحسبه
+            pass
+
+    if files:
+        with _file_budget_lock:
+            if len(files) <= _file_budget:
+                _file_budget -= len(files)
+            else:
+                # threads تانية خلصت الـ budget قبلنا
+                files = None
+
+    return total, files
+
+
+def _ignore_missing(func, path, exc):
+    """
+    handler لـ rmtree: ملف اتمسح من حد تاني أثناء المسح مش خطأ
+
+    onexc (3.12+) بيدي الـ exception نفسه، onerror بيدي exc_info
+    """
+    if isinstance(exc, tuple):
+        exc = exc[1]
+    if isinstance(exc, FileNotFoundError):
+        return
+    raise exc
+
+
+def _open_subdir(root_fd: int, rel_dir: str) -> int:
+    """
+    فتح فولدر جوه root_fd جزء جزء بـ O_NOFOLLOW
+
+    لو أي جزء اتبدل بـ symlink بعد التحليل الفتح بيفشل (OSError) بدل ما
+    نمسح ملفات برا الفولدر
+    """
+    fd = os.dup(root_fd)
+    if rel_dir:
+        for part in rel_dir.split(os.sep):
+            try:
+                next_fd = os.open(part, _DIR_OPEN_FLAGS, dir_fd=fd)
+            finally:
+                os.close(fd)
+            fd = next_fd
+    return fd
+
+
+def _unlink_by_inode(folder_path: Union[Path, str], files: List[Tuple[int, str]]):
+    """
+    مسح ملفات معروفة من التحليل بترتيب الـ inode (أقرب لترتيبها على الديسك)
+
+    كل فولدر بيتفتح مرة بـ O_NOFOLLOW والمسح بـ dir_fd - نفس أمان rmtree
+    قدام symlink اتحط مكان فولدر. أي حاجة مش متوقعة بتتساب لـ rmtree
+    """
+    # ملفات كل فولدر مع بعض، والفولدرات بترتيب أصغر inode فيها
+    groups = {}
+    for inode, rel_path in files:
+        parent, _, name = rel_path.rpartition(os.sep)
+        groups.setdefault(parent, []).append((inode, name))
+    # القايمة خلصت مهمتها - منسيبهاش في الذاكرة
+    files.clear()
+
+    root_fd = os.open(folder_path, _DIR_OPEN_FLAGS)
+    try:
+        for parent, names in sorted(groups.items(), key=lambda item: min(item[1])):
+            try:
+                dir_fd = _open_subdir(root_fd, parent)
+            except OSError:
+                continue
+            try:
+                names.sort()
+                for _, name in names:
+                    try:
+                        os.unlink(name, dir_fd=dir_fd)
+                    except OSError:
+                        # اتمسح أو اتغير من بعد التحليل - rmtree هيتصرف
+                        continue
+            finally:
+                os.close(dir_fd)
+    finally:
+        os.close(root_fd)
+
+
+def _volume_trash(folder_path: Path) -> Optional[Path]:
+    """
+    سلة المهملات الخاصة بالـ volume اللي عليه الفولدر (<mount>/.Trashes/<uid>)
+
+    Returns:
+        None لو الـ volume مفيهوش .Trashes (مش macOS أو Finder مأنشأهاش)
+    """
+    mount = os.path.abspath(folder_path)
+    while not os.path.ismount(mount):
+        mount = os.path.dirname(mount)
+    trashes = os.path.join(mount, ".Trashes")
+    if not hasattr(os, 'getuid') or not os.path.isdir(trashes):
+        return None
+    return Path(trashes) / str(os.getuid())
+
+
+def _move_to_trash(folder_path: Path) -> Tuple[bool, str]:
+    """
+    نقل الفولدر لسلة المهملات بـ rename واحد (metadata بس، ومن غير نسخ)
+
+    ~/.Trash الأول، ولو على volume تاني (EXDEV) سلة الـ volume نفسه.
+    مفيش رجوع للمسح النهائي أبداً - لو مفيش سلة ينفع نرجع فشل للفولدر ده
+
+    Returns:
+        (اتنقل/لا, رسالة الخطأ إن وجد)
+    """
+    # اسم فريد - ممكن يكون فيه "Render Files" تانية في الـ Trash
+    name = f"{folder_path.name}_{uuid.uuid4().hex}"
+
+    for trash_dir in (Path.home() / ".Trash", None):
+        if trash_dir is None:
+            trash_dir = _volume_trash(folder_path)
+            if trash_dir is None:
+                return False, "Not trashed (different volume)"
+        try:
+            trash_dir.mkdir(mode=0o700, exist_ok=True)
+            os.rename(folder_path, trash_dir / name)
+            return True, ""
+        except FileNotFoundError:
+            if not os.path.lexists(folder_path):
+                return True, "Already deleted"
+            return False, f"Not trashed: {trash_dir} is missing"
+        except OSError as e:
+            if e.errno != errno.EXDEV:
+                return False, f"Not trashed: {e.strerror or e}"
+            # على volume تاني - نجرب سلة الـ volume
+
+    return False, "Not trashed (different volume)"
+
+
+def delete_folder_safely(folder_path: Path,
+                         files: Optional[List[Tuple[int, str]]] = None,
+                         trash: bool = False) -> Tuple[bool, str]:
     """
     مسح فولدر بطريقة آمنة مع معالجة الأخطاء
 
     Args:
         folder_path: مسار الفولدر المراد مسحه
+        files: قايمة (inode, المسار النسبي) من analyze_bundle لو موجودة -
+               بتتمسح الأول بالترتيب، وrmtree بيشيل الباقي (المخفي والفولدرات
+               الفاضية وأي حاجة اتغيرت)
+        trash: نقل لسلة المهملات بدل المسح النهائي - لو مفيش سلة على نفس
+               الـ volume بيرجع فشل ("Not trashed ...") ومش بيمسح حاجة
 
     Returns:
         (نجح/فشل, رسالة الخطأ إن وجد)
     """
     try:
-        shutil.rmtree(folder_path)
+        if trash:
+            return _move_to_trash(folder_path)
+
+        if files and _UNLINK_BY_FD:
+            try:
+                _unlink_by_inode(folder_path, files)
+            except OSError:
+                # الفولدر نفسه اتغير - rmtree تحت بيقرر ويرجع الخطأ الصح
+                pass
+
+        if sys.version_info >= (3, 12):
+            shutil.rmtree(folder_path, onexc=_ignore_missing)
+        else:
+            shutil.rmtree(folder_path, onerror=_ignore_missing)
         return True, ""
 
     except PermissionError:
@@ -229,9 +531,9 @@ def delete_folder_safely(folder_path: Path) -> Tuple[bool, str]:
         return False, f"Unknown error: {str(e)}"
 
 
-def get_folder_count(folder_path: Path) -> int:
+def get_folder_count(folder_path: Union[Path, str]) -> int:
     """
-    حساب عدد الملفات في فولدر
+    حساب عدد الملفات في فولدر (نفس عدّ os.walk) - من غير stat للملفات العادية
 
     Args:
         folder_path: مسار الفولدر
@@ -239,13 +541,7 @@ def get_folder_count(folder_path: Path) -> int:
     Returns:
         عدد الملفات
     """
-    count = 0
-    try:
-        for _, _, filenames in os.walk(folder_path):
-            count += len(filenames)
-    except (PermissionError, OSError):
-        pass
-    return count
+    return sum(1 for _ in _iter_file_entries(folder_path, all_files=True))
 
 
 def validate_path(path_str: str) -> Tuple[bool, Optional[Path], str]:
@@ -285,6 +581,8 @@ def validate_path(path_str: str) -> Tuple[bool, Optional[Path], str]:
 class ScanProgress:
     """
     كلاس بسيط لتتبع تقدم عملية المسح
+
+    update_bundle_analyzed بيتنادى من threads التحليل فالعدادات عليها lock
     """
 
     def __init__(self):
@@ -292,17 +590,21 @@ class ScanProgress:
         self.bundles_analyzed = 0
         self.current_bundle = None
         self.total_size = 0
+        self.total_cleanable = 0
         self.start_time = datetime.now()
+        self._lock = threading.Lock()
 
     def update_bundle_found(self, bundle_path: Path):
         """تحديث عند إيجاد bundle جديد"""
         self.bundles_found += 1
         self.current_bundle = bundle_path.name
 
-    def update_bundle_analyzed(self, size: int):
+    def update_bundle_analyzed(self, size: int, cleanable_size: int = 0):
         """تحديث عند انتهاء تحليل bundle"""
-        self.bundles_analyzed += 1
-        self.total_size += size
+        with self._lock:
+            self.bundles_analyzed += 1
+            self.total_size += size
+            self.total_cleanable += cleanable_size
 
     def get_elapsed_time(self) -> str:
         """الحصول على الوقت المنقضي"""
@@ -319,6 +621,7 @@ class ScanProgress:
 # Export public API
 __all__ = [
     'TARGET_FOLDERS',
+    'TARGET_FOLDERS_SET',
     'format_size',
     'get_folder_size',
     'find_fcpbundles',